@@ -1,26 +1,44 @@
 import os
 import sys
+import atexit
 from typing import Tuple
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import logging
+import logging.handlers
 from configs.logger_config import log_file_path, error_log_file_path
 from dotenv import load_dotenv
 load_dotenv()
 
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+# Info records are buffered in memory and written to disk in bulk;
+# an ERROR record (or a full buffer) flushes the buffer immediately
+LOG_BUFFER_CAPACITY = 1024
+
+file_handler = logging.FileHandler(log_file_path)
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+logger_handler = logging.handlers.MemoryHandler(
+    capacity=LOG_BUFFER_CAPACITY,
+    flushLevel=logging.ERROR,
+    target=file_handler,
+)
+atexit.register(logger_handler.flush)
+
 logging.basicConfig(
-    filename=log_file_path,
     level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    handlers=[logger_handler],
 )
 
+# error_logger only emits ERROR records, each of which would flush a
+# buffer straight away, so its file handler is used directly
 error_logger = logging.getLogger("error_logger")
 error_logger.setLevel(logging.ERROR)
 error_handler = logging.FileHandler(error_log_file_path)
 error_logger.addHandler(error_handler)
 
-logger_handler = logging.FileHandler(log_file_path)
+# Records propagate to the root handler above; attaching another handler
+# for the same file here would write every record twice
 logger = logging.getLogger("logger")
-logger.addHandler(logger_handler)
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets",
           "https://www.googleapis.com/auth/drive.readonly"]
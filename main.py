@@ -1,6 +1,7 @@
 """
 Main script to run the automated review analysis pipeline.
 """
+import logging
 import sys
 from src.etl import run_etl_pipeline
 from src.analysis import (
@@ -14,6 +15,9 @@ def main():
     """
     Main entry point for the review analysis pipeline.
     """
+    # Show the pipeline modules' log messages alongside the progress output
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     try:
         print("Starting Automated Review Analysis Pipeline")
         print()
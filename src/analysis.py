@@ -1,12 +1,113 @@
 """
 Analysis functions for generating insights from processed review data.
 """
+import copy
+import functools
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 import matplotlib.pyplot as plt
 import os
 
 
+# Sentiments produced by a successful LLM analysis
+VALID_SENTIMENTS = ['Positive', 'Negative', 'Neutral']
+
+# Number of reports kept by _hash_cached
+REPORT_CACHE_SIZE = 32
+
+
+def _hash_cached(func: Callable) -> Callable:
+    """
+    Cache a report function on a hash of the columns it reads.
+    
+    The wrapped function is called as func(df, class_column, sentiment_column)
+    and only depends on those two columns, so they are hashed (order
+    independently) together with the column names to form the cache key.
+    Repeated calls on unchanged data reuse the cached report instead of
+    recomputing it. Every call returns its own deep copy, so callers can
+    modify their report without affecting later calls. Use
+    wrapper.cache_clear() to reset.
+    
+    Args:
+        func: Report function to wrap
+        
+    Returns:
+        Callable: The caching wrapper
+    """
+    cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+    
+    @functools.wraps(func)
+    def wrapper(
+        df: pd.DataFrame,
+        class_column: str = "Class Name",
+        sentiment_column: str = "AI Sentiment"
+    ) -> Dict:
+        hashes = pd.util.hash_pandas_object(df[[class_column, sentiment_column]], index=False)
+        key = (class_column, sentiment_column, len(df), int(hashes.sum()))
+        
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = func(df, class_column, sentiment_column)
+            if len(cache) > REPORT_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        return copy.deepcopy(cache[key])
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def _with_category_keys(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Return df with the given low-cardinality key columns as category dtype.
+    
+    Columns that are already categorical (e.g. 'AI Sentiment' coming out of
+    the ETL) are left as they are, so no conversion is paid twice.
+    
+    Args:
+        df: DataFrame to convert
+        columns: Names of the grouping/filter key columns
+        
+    Returns:
+        pd.DataFrame: DataFrame sharing its other columns with df
+    """
+    to_convert = {
+        col: df[col].astype('category')
+        for col in columns
+        if not isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**to_convert) if to_convert else df
+
+
+def _sentiment_stats(
+    df_valid: pd.DataFrame,
+    class_column: str,
+    sentiment_column: str
+) -> pd.DataFrame:
+    """
+    Compute sentiment counts and percentages by class on pre-filtered data.
+    
+    Args:
+        df_valid: DataFrame containing only rows with a valid sentiment
+        class_column: Name of the column containing clothing class
+        sentiment_column: Name of the column containing sentiment
+        
+    Returns:
+        pd.DataFrame: Sentiment counts and percentages by class
+    """
+    # Group by class and sentiment (observed=True skips unused categories)
+    sentiment_stats = df_valid.groupby([class_column, sentiment_column], observed=True).size().reset_index(name='count')
+    
+    # Total reviews per class, summed from the counts instead of a second groupby + merge
+    sentiment_stats['total'] = sentiment_stats.groupby(class_column, observed=True)['count'].transform('sum')
+    sentiment_stats['percentage'] = (sentiment_stats['count'] / sentiment_stats['total'] * 100).round(2)
+    
+    return sentiment_stats
+
+
 def calculate_sentiment_by_class(
     df: pd.DataFrame,
     class_column: str = "Class Name",
@@ -23,20 +124,14 @@ def calculate_sentiment_by_class(
     Returns:
         pd.DataFrame: Sentiment counts and percentages by class
     """
-    # Filter out empty sentiments
-    df_filtered = df[df[sentiment_column].isin(['Positive', 'Negative', 'Neutral'])].copy()
-    
-    # Group by class and sentiment
-    sentiment_counts = df_filtered.groupby([class_column, sentiment_column]).size().reset_index(name='count')
+    # Only the two key columns are needed; categorical keys make the filter
+    # and groupby work on integer codes
+    df = _with_category_keys(df[[class_column, sentiment_column]], [class_column, sentiment_column])
     
-    # Calculate total reviews per class
-    class_totals = df_filtered.groupby(class_column).size().reset_index(name='total')
+    # Filter out empty (and failed) sentiments before grouping
+    df_filtered = df.loc[df[sentiment_column].isin(VALID_SENTIMENTS)]
     
-    # Merge to get percentages
-    sentiment_stats = sentiment_counts.merge(class_totals, on=class_column)
-    sentiment_stats['percentage'] = (sentiment_stats['count'] / sentiment_stats['total'] * 100).round(2)
-    
-    return sentiment_stats
+    return _sentiment_stats(df_filtered, class_column, sentiment_column)
 
 
 def get_top_sentiment_classes(
@@ -57,22 +152,24 @@ def get_top_sentiment_classes(
     Returns:
         Tuple of (class_name, percentage)
     """
-    filtered = sentiment_stats[sentiment_stats[sentiment_column] == sentiment]
+    filtered = sentiment_stats.loc[sentiment_stats[sentiment_column] == sentiment, [class_column, 'percentage']]
     
-    if len(filtered) == 0:
+    if filtered.empty:
         return ("None", 0.0)
     
-    top_row = filtered.loc[filtered['percentage'].idxmax()]
-    return (top_row[class_column], top_row['percentage'])
+    # Positional argmax avoids label lookups; ties go to the first class, as with idxmax
+    top = filtered['percentage'].to_numpy().argmax()
+    return (filtered[class_column].iat[top], float(filtered['percentage'].iat[top]))
 
 
-def generate_sentiment_analysis_report(
+@_hash_cached
+def _build_sentiment_report(
     df: pd.DataFrame,
     class_column: str = "Class Name",
     sentiment_column: str = "AI Sentiment"
 ) -> Dict:
     """
-    Generate a comprehensive sentiment analysis report.
+    Compute the sentiment analysis report without printing it.
     
     Args:
         df: Processed DataFrame with sentiment analysis
@@ -82,18 +179,20 @@ def generate_sentiment_analysis_report(
     Returns:
         Dict containing analysis results and insights
     """
-    print("\n" + "=" * 60)
-    print("Generating Sentiment Analysis Report")
-    print("=" * 60)
+    # Only the two key columns are needed; categorical keys make the filter,
+    # groupby and counts work on integer codes
+    df = _with_category_keys(df[[class_column, sentiment_column]], [class_column, sentiment_column])
     
-    # Calculate sentiment statistics
-    sentiment_stats = calculate_sentiment_by_class(df, class_column, sentiment_column)
+    # Filter out empty sentiments once and reuse the result
+    df_valid = df.loc[df[sentiment_column].isin(VALID_SENTIMENTS)]
     
-    # Overall sentiment distribution
-    overall_sentiment = df[df[sentiment_column].isin(['Positive', 'Negative', 'Neutral'])][sentiment_column].value_counts()
-    total_reviews = len(df[df[sentiment_column].isin(['Positive', 'Negative', 'Neutral'])])
+    # Calculate sentiment statistics
+    sentiment_stats = _sentiment_stats(df_valid, class_column, sentiment_column)
     
-    overall_percentages = (overall_sentiment / total_reviews * 100).round(2)
+    # Overall sentiment distribution (normalized within the same counting pass)
+    overall_percentages = df_valid[sentiment_column].value_counts(normalize=True).mul(100).round(2)
+    overall = {sentiment: float(overall_percentages.get(sentiment, 0.0)) for sentiment in VALID_SENTIMENTS}
+    total_reviews = len(df_valid)
     
     # Get top classes for each sentiment
     top_positive_class, top_positive_pct = get_top_sentiment_classes(sentiment_stats, 'Positive', class_column, sentiment_column)
@@ -103,9 +202,9 @@ def generate_sentiment_analysis_report(
     # Compile report
     report = {
         'overall_sentiment': {
-            'positive': overall_percentages.get('Positive', 0),
-            'negative': overall_percentages.get('Negative', 0),
-            'neutral': overall_percentages.get('Neutral', 0),
+            'positive': overall['Positive'],
+            'negative': overall['Negative'],
+            'neutral': overall['Neutral'],
             'total_reviews': total_reviews
         },
         'by_class': sentiment_stats,
@@ -125,6 +224,47 @@ def generate_sentiment_analysis_report(
         }
     }
     
+    return report
+
+
+def clear_report_cache() -> None:
+    """
+    Forget all reports cached by generate_sentiment_analysis_report.
+    
+    Returns:
+        None
+    """
+    _build_sentiment_report.cache_clear()
+
+
+def generate_sentiment_analysis_report(
+    df: pd.DataFrame,
+    class_column: str = "Class Name",
+    sentiment_column: str = "AI Sentiment"
+) -> Dict:
+    """
+    Generate a comprehensive sentiment analysis report.
+    
+    The report is computed once per distinct class/sentiment data and
+    reused afterwards; it is printed on every call.
+    
+    Args:
+        df: Processed DataFrame with sentiment analysis
+        class_column: Name of the column containing clothing class
+        sentiment_column: Name of the column containing sentiment
+        
+    Returns:
+        Dict containing analysis results and insights
+    """
+    print("\n" + "=" * 60)
+    print("Generating Sentiment Analysis Report")
+    print("=" * 60)
+    
+    report = _build_sentiment_report(df, class_column, sentiment_column)
+    top_positive = report['top_classes']['highest_positive']
+    top_negative = report['top_classes']['highest_negative']
+    top_neutral = report['top_classes']['highest_neutral']
+    
     # Print report
     print("\n Overall Sentiment Distribution:")
     print(f"  Positive: {report['overall_sentiment']['positive']:.2f}%")
@@ -133,12 +273,12 @@ def generate_sentiment_analysis_report(
     print(f"  Total Reviews Analyzed: {report['overall_sentiment']['total_reviews']}")
     
     print("\n Top Classes by Sentiment:")
-    print(f"  Highest Positive Sentiment: {top_positive_class} ({top_positive_pct:.2f}%)")
-    print(f"  Highest Negative Sentiment: {top_negative_class} ({top_negative_pct:.2f}%)")
-    print(f"  Highest Neutral Sentiment:  {top_neutral_class} ({top_neutral_pct:.2f}%)")
+    print(f"  Highest Positive Sentiment: {top_positive['class']} ({top_positive['percentage']:.2f}%)")
+    print(f"  Highest Negative Sentiment: {top_negative['class']} ({top_negative['percentage']:.2f}%)")
+    print(f"  Highest Neutral Sentiment:  {top_neutral['class']} ({top_neutral['percentage']:.2f}%)")
     
     print("\n📋 Detailed Breakdown by Class:")
-    print(sentiment_stats.to_string(index=False))
+    print(report['by_class'].to_string(index=False))
     
     return report
 
@@ -185,18 +325,30 @@ def create_sentiment_visualizations(
     # 2. Sentiment by Class Bar Chart
     sentiment_stats = report['by_class']
     
-    # Pivot the data for easier plotting
-    pivot_data = sentiment_stats.pivot(index='Class Name', columns='AI Sentiment', values='percentage').fillna(0)
+    # Percentages as a (class x sentiment) array in a fixed sentiment order,
+    # so each sentiment always gets its own color
+    percentage_table = (
+        sentiment_stats.set_index(['Class Name', 'AI Sentiment'])['percentage']
+        .unstack(fill_value=0)
+        .reindex(columns=sentiments, fill_value=0)
+    )
+    class_names = percentage_table.index.tolist()
+    values = percentage_table.to_numpy(dtype=float)
+    
+    x = np.arange(len(class_names))
+    width = 0.8 / len(sentiments)
     
     fig, ax = plt.subplots(figsize=(14, 8))
     
-    pivot_data.plot(kind='bar', ax=ax, color=['#28a745', '#dc3545', '#6c757d'], width=0.8)
+    for i, (sentiment, color) in enumerate(zip(sentiments, colors)):
+        ax.bar(x + (i - 1) * width, values[:, i], width=width, color=color, label=sentiment)
     
     ax.set_title('Sentiment Distribution by Clothing Class', fontsize=16, fontweight='bold')
     ax.set_xlabel('Clothing Class', fontsize=12)
     ax.set_ylabel('Percentage (%)', fontsize=12)
     ax.legend(title='Sentiment', fontsize=10)
-    ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.set_xticks(x)
+    ax.set_xticklabels(class_names, rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3)
     
     plt.tight_layout()
@@ -267,4 +419,30 @@ def export_analysis_to_csv(
     
     print(f"\n Exported detailed analysis to '{output_file}'")
     
-    return output_file
\ No newline at end of file
+    return output_file
+
+
+def export_analysis_to_parquet(
+    report: Dict,
+    output_file: str = "sentiment_analysis_report.parquet"
+) -> str:
+    """
+    Export the analysis report to a Parquet file.
+    
+    Smaller and faster to load than the CSV export, and keeps column dtypes.
+    Requires pyarrow.
+    
+    Args:
+        report: The analysis report dictionary
+        output_file: Path to output Parquet file
+        
+    Returns:
+        str: Path to the saved file
+    """
+    # Export the detailed breakdown
+    sentiment_stats = report['by_class']
+    sentiment_stats.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+    
+    print(f"\n Exported detailed analysis to '{output_file}'")
+    
+    return output_file
@@ -1,20 +1,31 @@
 """
 ETL (Extract, Transform, Load) functions for the review analysis pipeline.
 """
+import numpy as np
 import pandas as pd
 import gspread
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 from src.utils import (
     get_spreadsheet,
     get_worksheet,
     create_worksheet_if_not_exists,
     read_worksheet_to_dataframe,
+    read_worksheet_in_chunks,
     write_dataframe_to_worksheet,
-    clean_text,
-    is_worksheet_protected
+    clean_text_series,
+    downcast_integer_columns,
+    is_worksheet_protected,
+    CHUNK_ROWS
 )
 from src.llm_analysis import batch_analyze_reviews
 
+# Every value the 'AI Sentiment' column can hold after LLM analysis
+SENTIMENT_CATEGORIES = ['Positive', 'Negative', 'Neutral', 'Error', '']
+
+# Every value the 'Action Needed?' column can hold
+ACTION_CATEGORIES = ['Yes', 'No', '']
+
 
 def extract_raw_data(
     sheet_id: Optional[str] = None,
@@ -47,6 +58,45 @@ def extract_raw_data(
     return df
 
 
+def extract_raw_data_chunks(
+    sheet_id: Optional[str] = None,
+    raw_worksheet_name: str = "raw_data",
+    credentials_file: str = "credentials.json",
+    chunk_rows: int = CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """
+    Extract data from the raw_data worksheet in chunks.
+    
+    Streaming alternative to extract_raw_data for sheets too large to hold
+    in memory at once; each chunk can be transformed and loaded before the
+    next one is read.
+    
+    Args:
+        sheet_id: Google Sheets ID
+        raw_worksheet_name: Name of the raw data worksheet
+        credentials_file: Path to credentials file
+        chunk_rows: Maximum number of rows per chunk
+        
+    Returns:
+        Iterator[pd.DataFrame]: Chunks of raw data from the worksheet
+    """
+    print(f"Extracting data from '{raw_worksheet_name}' worksheet in chunks of {chunk_rows} rows...")
+    
+    spreadsheet = get_spreadsheet(sheet_id, credentials_file)
+    raw_worksheet = get_worksheet(spreadsheet, raw_worksheet_name)
+    
+    # Verify the worksheet is protected
+    if not is_worksheet_protected(raw_worksheet):
+        print(f"Warning: '{raw_worksheet_name}' worksheet is not protected!")
+    
+    total_rows = 0
+    for chunk in read_worksheet_in_chunks(raw_worksheet, chunk_rows):
+        total_rows += len(chunk)
+        yield chunk
+    
+    print(f"Extracted {total_rows} rows from raw data")
+
+
 def transform_staging_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Transform and clean data for staging.
@@ -59,22 +109,18 @@ def transform_staging_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     print("Transforming data for staging...")
     
-    # Create a copy to avoid modifying original
-    df_transformed = df.copy()
+    # Shallow copy: columns are replaced rather than modified, so the
+    # original is left untouched without duplicating its data
+    df_transformed = df.copy(deep=False)
     
     # Get initial shape
     initial_rows = len(df_transformed)
     
-    # Clean text columns (assuming common column names from the dataset)
-    text_columns = ['Title', 'Review Text']
-    for col in text_columns:
-        if col in df_transformed.columns:
-            df_transformed[col] = df_transformed[col].apply(clean_text)
-    
-    # Clean other text columns that might exist
-    for col in df_transformed.columns:
-        if df_transformed[col].dtype == 'object':
-            df_transformed[col] = df_transformed[col].apply(clean_text)
+    # Clean all text columns (including 'Title' and 'Review Text') in one
+    # bulk assignment of vectorized column cleans
+    text_columns = df_transformed.select_dtypes(include=['object', 'string']).columns
+    if len(text_columns) > 0:
+        df_transformed[text_columns] = df_transformed[text_columns].apply(clean_text_series)
     
     # Remove completely empty rows (all values are empty strings or NaN)
     df_transformed = df_transformed.replace('', pd.NA)
@@ -161,7 +207,8 @@ def prepare_processed_dataframe(df_staging: pd.DataFrame) -> pd.DataFrame:
     """
     print("Preparing processed DataFrame structure...")
     
-    df_processed = df_staging.copy()
+    # Shallow copy: only new columns are added, so no data needs duplicating
+    df_processed = df_staging.copy(deep=False)
     
     # Add new columns for LLM results
     df_processed['AI Sentiment'] = ''
@@ -209,7 +256,8 @@ def run_etl_pipeline(
     sheet_id: Optional[str] = None,
     credentials_file: str = "credentials.json",
     run_llm_analysis: bool = True,
-    review_column: str = "Review Text"
+    review_column: str = "Review Text",
+    llm_cache_file: Optional[str] = "llm_cache.json"
 ) -> pd.DataFrame:
     """
     Run the complete ETL pipeline from raw to staging to processed with LLM analysis.
@@ -221,6 +269,7 @@ def run_etl_pipeline(
         credentials_file: Path to credentials file
         run_llm_analysis: Whether to run LLM analysis on reviews
         review_column: Name of the column containing review text
+        llm_cache_file: JSON file caching LLM analyses across runs (None disables it)
         
     Returns:
         pd.DataFrame: Processed DataFrame with LLM analysis results
@@ -230,46 +279,65 @@ def run_etl_pipeline(
     print("=" * 60)
     
     # Extract from raw_data
-    df_raw = extract_raw_data(sheet_id, credentials_file=credentials_file)
+    df_raw = downcast_integer_columns(extract_raw_data(sheet_id, credentials_file=credentials_file))
     
-    # Transform for staging
+    # Transform for staging (the raw frame is not needed afterwards)
     df_staging = transform_staging_data(df_raw)
-    
-    # Load to staging
-    load_staging_data(df_staging, sheet_id, credentials_file=credentials_file)
-    
-    # Prepare processed structure
-    df_processed = prepare_processed_dataframe(df_staging)
-    
-    # Run LLM analysis if requested
-    if run_llm_analysis:
-        print("\n" + "=" * 60)
-        print("Running LLM Analysis")
-        print("=" * 60)
+    del df_raw
+    
+    # Load to staging in the background: the staging write is pure I/O and
+    # independent of the LLM analysis, so the two overlap
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        staging_load = executor.submit(
+            load_staging_data, df_staging, sheet_id, credentials_file=credentials_file
+        )
         
-        # Check if review column exists
-        if review_column not in df_processed.columns:
-            print(f"Warning!: Column '{review_column}' not found in data")
-            print(f"Available columns: {df_processed.columns.tolist()}")
-            print("Skipping LLM analysis...")
-        else:
-            # Get reviews from the specified column
-            reviews = df_processed[review_column].fillna('').tolist()
-            
-            print(f"Analyzing {len(reviews)} reviews...")
-            
-            # Batch analyze all reviews
-            results = batch_analyze_reviews(reviews)
-            
-            # Add results to dataframe
-            df_processed['AI Sentiment'] = [r['sentiment'] for r in results]
-            df_processed['AI Summary'] = [r['summary'] for r in results]
-            df_processed['Action Needed?'] = [r['action_needed'] for r in results]
+        # Prepare processed structure
+        df_processed = prepare_processed_dataframe(df_staging)
+        
+        # Run LLM analysis if requested
+        if run_llm_analysis:
+            print("\n" + "=" * 60)
+            print("Running LLM Analysis")
+            print("=" * 60)
             
-            print(f" LLM analysis completed")
-            print(f"  - Positive: {sum(1 for r in results if r['sentiment'] == 'Positive')}")
-            print(f"  - Negative: {sum(1 for r in results if r['sentiment'] == 'Negative')}")
-            print(f"  - Neutral: {sum(1 for r in results if r['sentiment'] == 'Neutral')}")
+            # Check if review column exists
+            if review_column not in df_processed.columns:
+                print(f"Warning!: Column '{review_column}' not found in data")
+                print(f"Available columns: {df_processed.columns.tolist()}")
+                print("Skipping LLM analysis...")
+            else:
+                # Only reviews with text are sent to the LLM; empty ones keep '' results
+                has_text = (
+                    df_processed[review_column].astype('string').str.strip().fillna('').ne('')
+                ).to_numpy(dtype=bool)
+                reviews = df_processed.loc[has_text, review_column].tolist()
+                
+                print(f"Analyzing {len(reviews)} reviews ({len(has_text) - len(reviews)} empty reviews skipped)...")
+                
+                # Batch analyze all non-empty reviews
+                results = batch_analyze_reviews(reviews, cache_file=llm_cache_file)
+                
+                # Add results to dataframe at the positions of the analyzed reviews
+                sentiments = np.full(len(df_processed), '', dtype=object)
+                summaries = np.full(len(df_processed), '', dtype=object)
+                sentiments[has_text] = [r['sentiment'] for r in results]
+                summaries[has_text] = [r['summary'] for r in results]
+                
+                df_processed['AI Sentiment'] = pd.Categorical(sentiments, categories=SENTIMENT_CATEGORIES)
+                df_processed['AI Summary'] = summaries
+                df_processed['Action Needed?'] = pd.Categorical(
+                    np.where(df_processed['AI Sentiment'].eq('Negative'), 'Yes', 'No'),
+                    categories=ACTION_CATEGORIES
+                )
+                
+                print(f" LLM analysis completed")
+                print(f"  - Positive: {sum(1 for r in results if r['sentiment'] == 'Positive')}")
+                print(f"  - Negative: {sum(1 for r in results if r['sentiment'] == 'Negative')}")
+                print(f"  - Neutral: {sum(1 for r in results if r['sentiment'] == 'Neutral')}")
+        
+        # Staging must be written (and any error surfaced) before processed
+        staging_load.result()
     
     # Load processed data with LLM results
     load_processed_data(df_processed, sheet_id, credentials_file=credentials_file)
@@ -1,38 +1,233 @@
 """
 LLM analysis functions using Groq API for sentiment analysis and summarization.
 """
+import asyncio
 import os
-from dotenv import load_dotenv
-from groq import Groq
-from typing import Dict, Tuple, Optional
+import functools
+import hashlib
+import json
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from groq import (
+    Groq,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError
+)
+from typing import Dict, List, Tuple, Optional
 import time
+from src.utils import _ensure_env
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# Number of reviews analyzed concurrently (the workload is network-bound)
+MAX_WORKERS = 8
 
-def get_groq_client() -> Groq:
+# Number of reviews packed into a single prompt by batch_analyze_reviews_bulk
+BULK_CHUNK_SIZE = 20
+
+# Upper bound in seconds for a single wait between API retries
+MAX_RETRY_DELAY = 30.0
+
+# Seconds before a single Groq API request is abandoned (and retried)
+REQUEST_TIMEOUT = 20.0
+
+# Cap on the tokens generated for one review (a sentiment and a sentence)
+MAX_OUTPUT_TOKENS = 150
+
+# Output tokens allowed per review in a packed call; JSON entries carry only
+# the sentiment and summary, so they need less than a standalone answer
+BULK_TOKENS_PER_REVIEW = 100
+
+# Transient failures worth retrying; anything else fails the review at once
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Default request budget of batch_analyze_reviews (Groq's free-tier limit for
+# llama-3.3-70b-versatile); raise it on paid plans
+REQUESTS_PER_MINUTE = 30
+
+# Matches every "Sentiment: ..." / "Summary: ..." line of an LLM response; the
+# value runs greedily to the end of the line and is stripped afterwards, so
+# there is no lazy group for the engine to backtrack over
+_RESPONSE_LINE_RE = re.compile(
+    r'^[ \t]*(Sentiment|Summary):(.*)$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Normalized sentiment label for each lowercase answer
+_SENTIMENT_LOOKUP = {
+    'positive': 'Positive',
+    'negative': 'Negative',
+    'neutral': 'Neutral'
+}
+
+# Sentiments of a successful analysis (as opposed to '' or 'Error')
+_VALID_SENTIMENTS = frozenset(_SENTIMENT_LOOKUP.values())
+
+
+# Guards the client cache: worker threads may ask for the client at the same
+# time, and only one of them should create it
+_CLIENT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_groq_client() -> Groq:
     """
-    Create and return a Groq client instance.
+    Create the Groq client once and cache it.
     
     Returns:
         Groq: Authenticated Groq client
         
     Raises:
-        ValueError: If GROQ_API_KEY is not set
+        ValueError: If GROQ_API_KEY is not set (nothing is cached then)
     """
+    _ensure_env()
     api_key = os.getenv('GROQ_API_KEY')
     
     if not api_key:
         raise ValueError("GROQ_API_KEY not found in environment variables")
     
-    return Groq(api_key=api_key)
+    # Retries are handled by analyze_review_with_llm, not the SDK
+    return Groq(api_key=api_key, timeout=REQUEST_TIMEOUT, max_retries=0)
+
+
+def clear_groq_client_cache() -> None:
+    """
+    Forget the cached Groq client so the next call creates a new one.
+    
+    Returns:
+        None
+    """
+    with _CLIENT_LOCK:
+        _cached_groq_client.cache_clear()
+
+
+def get_groq_client() -> Groq:
+    """
+    Return the shared Groq client, creating it on first use.
+    
+    Every review reuses the same client and therefore the same HTTP
+    connection pool.
+    
+    Returns:
+        Groq: Authenticated Groq client
+        
+    Raises:
+        ValueError: If GROQ_API_KEY is not set
+    """
+    with _CLIENT_LOCK:
+        return _cached_groq_client()
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket spacing calls to a requests-per-minute budget.
+    
+    Up to `burst` calls may start immediately after an idle period; after
+    that, calls are spaced 60 / requests_per_minute seconds apart. Each caller
+    reserves its slot under the lock and then sleeps once outside it, so
+    waiting threads neither spin nor block each other's reservations.
+    """
+    
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self._interval = 60.0 / requests_per_minute
+        self._burst_window = self._interval * (max(1, burst) - 1)
+        # Start with a full bucket
+        self._next_slot = time.monotonic() - self._burst_window
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """
+        Block until the caller may send its request.
+        
+        Returns:
+            None
+        """
+        with self._lock:
+            now = time.monotonic()
+            # Unused capacity from idle periods is capped at `burst` calls
+            slot = max(self._next_slot, now - self._burst_window)
+            self._next_slot = slot + self._interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Compute how long to wait before retrying a failed API call.
+    
+    Rate limit errors honor the server's Retry-After header; other errors use
+    exponential backoff with full jitter. Both are capped at MAX_RETRY_DELAY.
+    
+    Args:
+        error: The exception raised by the failed call
+        attempt: Zero-based index of the failed attempt
+        
+    Returns:
+        float: Delay in seconds
+    """
+    if isinstance(error, RateLimitError):
+        try:
+            return min(float(error.response.headers.get('retry-after')), MAX_RETRY_DELAY)
+        except (TypeError, ValueError):
+            pass
+    
+    return random.uniform(0, min(2 ** attempt, MAX_RETRY_DELAY))
+
+
+def _completion_text(chat_completion) -> str:
+    """
+    Return the text of a chat completion, streamed or not.
+    
+    A streamed completion is read only until both the sentiment and the
+    summary line are complete; anything the model adds afterwards is never
+    waited for.
+    
+    Args:
+        chat_completion: A ChatCompletion or a stream of completion chunks
+        
+    Returns:
+        str: The response text
+    """
+    if hasattr(chat_completion, 'choices'):
+        return chat_completion.choices[0].message.content
+    
+    parts = []
+    try:
+        for chunk in chat_completion:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            
+            # Only whole lines are checked, so a summary is never cut short
+            if '\n' in delta:
+                text = ''.join(parts)
+                complete_lines = text[:text.rfind('\n')]
+                fields = {field.lower() for field, _ in _RESPONSE_LINE_RE.findall(complete_lines)}
+                if len(fields) == 2:
+                    break
+    finally:
+        # Stops the download of the remaining tokens after an early exit
+        close = getattr(chat_completion, 'close', None)
+        if close is not None:
+            close()
+    
+    return ''.join(parts)
 
 
 def analyze_review_with_llm(
     review_text: str,
     model: str = "llama-3.3-70b-versatile",
-    max_retries: int = 3
+    max_retries: int = 3,
+    limiter: Optional[_RateLimiter] = None
 ) -> Dict[str, str]:
     """
     Analyze a review using Groq LLM to extract sentiment and summary.
@@ -41,6 +236,8 @@ def analyze_review_with_llm(
         review_text: The review text to analyze
         model: The Groq model to use
         max_retries: Maximum number of retry attempts on failure
+        limiter: Rate limiter a retry takes a slot from before resending
+            (the caller paces the first attempt; None retries unpaced)
         
     Returns:
         Dict with keys 'sentiment' and 'summary'
@@ -80,11 +277,13 @@ If the review is too short to summarize meaningfully, just repeat the original t
                 ],
                 model=model,
                 temperature=0.3,  # Lower temperature for more consistent results
-                max_tokens=150
+                max_tokens=MAX_OUTPUT_TOKENS,
+                timeout=REQUEST_TIMEOUT,
+                stream=True
             )
             
             # Extract the response
-            response_text = chat_completion.choices[0].message.content.strip()
+            response_text = _completion_text(chat_completion).strip()
             
             # Parse the response
             sentiment, summary = parse_llm_response(response_text, review_text)
@@ -94,10 +293,12 @@ If the review is too short to summarize meaningfully, just repeat the original t
                 'summary': summary
             }
             
-        except Exception as e:
+        except RETRYABLE_ERRORS as e:
             if attempt < max_retries - 1:
                 print(f"  API call failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                time.sleep(1)  # Wait before retrying
+                time.sleep(_retry_delay(e, attempt))  # Back off before retrying
+                if limiter is not None:
+                    limiter.acquire()
                 continue
             else:
                 print(f"  Failed to analyze review after {max_retries} attempts: {str(e)}")
@@ -105,6 +306,14 @@ If the review is too short to summarize meaningfully, just repeat the original t
                     'sentiment': 'Error',
                     'summary': 'Failed to analyze'
                 }
+        
+        except Exception as e:
+            # Bad requests, auth errors and unexpected responses won't fix themselves
+            print(f"  Failed to analyze review: {str(e)}")
+            return {
+                'sentiment': 'Error',
+                'summary': 'Failed to analyze'
+            }
 
 
 def parse_llm_response(response_text: str, original_review: str) -> Tuple[str, str]:
@@ -121,30 +330,25 @@ def parse_llm_response(response_text: str, original_review: str) -> Tuple[str, s
     sentiment = "Neutral"
     summary = original_review
     
-    lines = response_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
+    for field, value in _RESPONSE_LINE_RE.findall(response_text):
+        value = value.strip()
         
         # Extract sentiment
-        if line.startswith('Sentiment:'):
-            sentiment_value = line.replace('Sentiment:', '').strip()
+        if field.lower() == 'sentiment':
+            sentiment_value = value.lower()
             # Validate sentiment
-            if sentiment_value in ['Positive', 'Negative', 'Neutral']:
-                sentiment = sentiment_value
-            elif 'positive' in sentiment_value.lower():
+            if sentiment_value in _SENTIMENT_LOOKUP:
+                sentiment = _SENTIMENT_LOOKUP[sentiment_value]
+            elif 'positive' in sentiment_value:
                 sentiment = 'Positive'
-            elif 'negative' in sentiment_value.lower():
+            elif 'negative' in sentiment_value:
                 sentiment = 'Negative'
             else:
                 sentiment = 'Neutral'
         
-        # Extract summary
-        elif line.startswith('Summary:'):
-            summary = line.replace('Summary:', '').strip()
-            # If summary is empty, use original review
-            if not summary:
-                summary = original_review
+        # Extract summary (if empty, use original review)
+        else:
+            summary = value or original_review
     
     return sentiment, summary
 
@@ -164,46 +368,375 @@ def determine_action_needed(sentiment: str) -> str:
     return 'No'
 
 
+def _normalize_review(review) -> str:
+    """
+    Normalize a review for deduplication; missing values become ''.
+    
+    Args:
+        review: Raw review value (str, None or NaN)
+        
+    Returns:
+        str: Stripped review text
+    """
+    if review is None or (isinstance(review, float) and review != review):
+        return ''
+    return str(review).strip()
+
+
+def _cache_key(review_text: str, model: str) -> str:
+    """
+    Build the persistent cache key for a review analyzed with a given model.
+    
+    Args:
+        review_text: Normalized review text
+        model: The Groq model used for the analysis
+        
+    Returns:
+        str: SHA-1 hex digest identifying the (model, review) pair
+    """
+    return hashlib.sha1(f"{model}\n{review_text}".encode('utf-8')).hexdigest()
+
+
+def _json_loads(data):
+    """
+    Decode JSON with orjson when installed, else with the json module.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        The decoded Python object
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Encode an object as UTF-8 JSON with orjson when installed, else with the json module.
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        bytes: The encoded JSON document
+    """
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode('utf-8')
+
+
+def load_analysis_cache(cache_file: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load previously computed LLM analyses from a JSON cache file.
+    
+    Args:
+        cache_file: Path to the cache file
+        
+    Returns:
+        Dict mapping cache keys to {'sentiment', 'summary'} dicts
+        (empty if the file is missing, unreadable or not a JSON object)
+    """
+    if not os.path.exists(cache_file):
+        return {}
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = _json_loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"  Ignoring unreadable analysis cache '{cache_file}': {str(e)}")
+        return {}
+    
+    # Valid JSON that is not an object (a list, a string, null) is no cache
+    if not isinstance(cache, dict):
+        print(f"  Ignoring analysis cache '{cache_file}': expected a JSON object")
+        return {}
+    
+    return cache
+
+
+def save_analysis_cache(cache: Dict[str, Dict[str, str]], cache_file: str) -> None:
+    """
+    Save LLM analyses to a JSON cache file.
+    
+    Args:
+        cache: Dict mapping cache keys to {'sentiment', 'summary'} dicts
+        cache_file: Path to the cache file
+        
+    Returns:
+        None
+    """
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(cache))
+    os.replace(tmp_file, cache_file)
+
+
 def batch_analyze_reviews(
     reviews: list,
     model: str = "llama-3.3-70b-versatile",
-    show_progress: bool = True
+    show_progress: bool = True,
+    max_workers: int = MAX_WORKERS,
+    cache_file: Optional[str] = None,
+    requests_per_minute: Optional[float] = REQUESTS_PER_MINUTE,
+    batch_size: int = 1
 ) -> list:
     """
     Analyze multiple reviews in batch.
     
+    Identical reviews (after stripping whitespace) are analyzed only once,
+    empty or missing reviews are not sent at all, and unique reviews are sent
+    to the LLM concurrently from a thread pool, paced
+    by a token bucket so the API's rate limit is not exceeded. With a
+    batch_size above 1, that many reviews share each API call (see
+    analyze_reviews_chunk_with_llm). When a cache file is given, successful
+    analyses are persisted there and reused on later runs. Results are
+    returned in the same order as the input reviews.
+    
     Args:
         reviews: List of review texts
         model: The Groq model to use
         show_progress: Whether to show progress indicators
+        max_workers: Maximum number of concurrent API calls
+        cache_file: Optional path to a JSON file caching previous analyses
+        requests_per_minute: Maximum rate of new API calls (None disables pacing)
+        batch_size: Number of reviews per API call; 1 sends each on its own
         
     Returns:
-        List of dicts with sentiment, summary, and action_needed for each review
+        List of dicts with sentiment and summary for each review
     """
-    results = []
-    total = len(reviews)
+    normalized = [_normalize_review(review) for review in reviews]
     
-    for idx, review in enumerate(reviews, 1):
-        if show_progress and idx % 10 == 0:
-            print(f"  Processing review {idx}/{total}...")
+    cache = load_analysis_cache(cache_file) if cache_file else {}
+    analyses = {}
+    pending: List[str] = []
+    
+    for text in dict.fromkeys(normalized):
+        if not text:
+            continue
+        cached = cache.get(_cache_key(text, model))
+        if cached is not None:
+            analyses[text] = cached
+        else:
+            pending.append(text)
+    
+    if show_progress and len(analyses) > 0:
+        print(f"  Reusing {len(analyses)} cached analyses")
+    
+    # Empty and missing reviews are answered here, without a worker,
+    # an API call or a rate limit slot
+    analyses[''] = {'sentiment': '', 'summary': ''}
+    
+    if batch_size > 1:
+        groups = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    else:
+        groups = [[text] for text in pending]
+    total = len(pending)
+    
+    # No burst allowance: every call, retries included, takes a slot, so even
+    # the first minute stays within requests_per_minute
+    limiter = _RateLimiter(requests_per_minute) if requests_per_minute else None
+    
+    def analyze(group: List[str]) -> List[Dict[str, str]]:
+        # Wait for a slot in the worker, so pacing never blocks result handling
+        if limiter is not None:
+            limiter.acquire()
+        if batch_size > 1:
+            return analyze_reviews_chunk_with_llm(group, model, limiter=limiter)
+        return [analyze_review_with_llm(group[0], model, limiter=limiter)]
+    
+    done = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(analyze, group): group for group in groups}
         
-        # Analyze the review
-        analysis = analyze_review_with_llm(review, model)
+        for future in as_completed(futures):
+            group = futures[future]
+            done += len(group)
+            if show_progress and done // 10 > (done - len(group)) // 10:
+                print(f"  Processing review {done}/{total}...")
+            
+            for text, analysis in zip(group, future.result()):
+                analyses[text] = analysis
+                
+                # Only cache real answers so failures are retried on the next run
+                if analysis['sentiment'] in _VALID_SENTIMENTS:
+                    cache[_cache_key(text, model)] = {
+                        'sentiment': analysis['sentiment'],
+                        'summary': analysis['summary']
+                    }
+    
+    if cache_file and total > 0:
+        save_analysis_cache(cache, cache_file)
+    
+    # Map unique analyses back to the original review positions
+    results = [dict(analyses[text]) for text in normalized]
+    
+    if show_progress:
+        print(f"Completed analyzing {len(reviews)} reviews ({len(groups)} LLM calls for {total} unique reviews)")
+    
+    return results
+
+
+async def batch_analyze_reviews_async(reviews: list, **kwargs) -> list:
+    """
+    Analyze multiple reviews in batch without blocking the event loop.
+    
+    Runs batch_analyze_reviews in a worker thread. Its thread pool already
+    keeps requests in flight while other workers wait for a rate limit
+    slot, so the event loop is only freed for the caller's own tasks.
+    
+    Args:
+        reviews: List of review texts
+        **kwargs: Any other argument accepted by batch_analyze_reviews
         
-        # Determine action needed
-        action_needed = determine_action_needed(analysis['sentiment'])
+    Returns:
+        List of dicts with sentiment and summary for each review
+    """
+    return await asyncio.to_thread(batch_analyze_reviews, reviews, **kwargs)
+
+
+def analyze_reviews_chunk_with_llm(
+    reviews: List[str],
+    model: str = "llama-3.3-70b-versatile",
+    max_retries: int = 3,
+    limiter: Optional[_RateLimiter] = None
+) -> List[Dict[str, str]]:
+    """
+    Analyze several non-empty reviews with a single Groq API call.
+    
+    The reviews are sent as a numbered list and the model is asked for a JSON
+    object with one {id, sentiment, summary} entry per review. Each entry is
+    validated with parse_llm_response. Transient API errors are retried with
+    the same backoff as analyze_review_with_llm, each retry taking a slot
+    from the limiter; if the call still fails, every review gets the 'Error'
+    result. Only reviews the response is unreadable or silent about are
+    analyzed one at a time, each taking a slot from the limiter first.
+    
+    Args:
+        reviews: List of non-empty review texts
+        model: The Groq model to use
+        max_retries: Maximum number of attempts for the packed call
+        limiter: Rate limiter paced by the caller, used for retries and
+            single-review fallback calls (None sends them unpaced)
+        
+    Returns:
+        List of dicts with keys 'sentiment' and 'summary', in input order
+    """
+    numbered_reviews = "\n".join(
+        f'{idx}. "{review}"' for idx, review in enumerate(reviews, 1)
+    )
+    
+    prompt = f"""Analyze each of the following customer reviews and provide:
+1. Sentiment: Classify as exactly one of: Positive, Negative, or Neutral
+2. Summary: Provide a one-sentence summary of the review
+
+Reviews:
+{numbered_reviews}
+
+Respond with a JSON object in the following format, with one entry per review:
+{{"results": [{{"id": 1, "sentiment": "Positive/Negative/Neutral", "summary": "One sentence summary"}}]}}
+
+If a review is too short to summarize meaningfully, just repeat the original text as the summary."""
+    
+    client = get_groq_client()
+    
+    for attempt in range(max_retries):
+        try:
+            chat_completion = client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt,
+                    }
+                ],
+                model=model,
+                temperature=0.3,  # Lower temperature for more consistent results
+                max_tokens=BULK_TOKENS_PER_REVIEW * len(reviews),
+                response_format={"type": "json_object"},
+                timeout=REQUEST_TIMEOUT
+            )
+            response_text = chat_completion.choices[0].message.content
+            break
         
+        except RETRYABLE_ERRORS as e:
+            if attempt < max_retries - 1:
+                print(f"  Bulk API call failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                time.sleep(_retry_delay(e, attempt))  # Back off before retrying
+                if limiter is not None:
+                    limiter.acquire()
+                continue
+            print(f"  Failed to analyze {len(reviews)} reviews after {max_retries} attempts: {str(e)}")
+            return [{'sentiment': 'Error', 'summary': 'Failed to analyze'} for _ in reviews]
+        
+        except Exception as e:
+            # Bad requests, auth errors and the like would fail per review too
+            print(f"  Failed to analyze {len(reviews)} reviews: {str(e)}")
+            return [{'sentiment': 'Error', 'summary': 'Failed to analyze'} for _ in reviews]
+    
+    try:
+        items = {int(item['id']): item for item in _json_loads(response_text)['results']}
+    except (TypeError, ValueError, KeyError) as e:
+        print(f"  Unreadable bulk response, falling back to single reviews: {str(e)}")
+        items = {}
+    
+    results = []
+    for idx, review in enumerate(reviews, 1):
+        item = items.get(idx)
+        
+        # A null or non-string field counts as missing, so it is never
+        # parsed (and cached) as the literal text "None"
+        if (
+            not isinstance(item, dict)
+            or not isinstance(item.get('sentiment'), str)
+            or not isinstance(item.get('summary'), str)
+        ):
+            if limiter is not None:
+                limiter.acquire()
+            results.append(analyze_review_with_llm(review, model, limiter=limiter))
+            continue
+        
+        sentiment, summary = parse_llm_response(
+            f"Sentiment: {item['sentiment']}\nSummary: {item['summary']}",
+            review
+        )
         results.append({
-            'sentiment': analysis['sentiment'],
-            'summary': analysis['summary'],
-            'action_needed': action_needed
+            'sentiment': sentiment,
+            'summary': summary
         })
-        
-        # Small delay to avoid rate limiting
-        if idx % 20 == 0:
-            time.sleep(0.5)
     
-    if show_progress:
-        print(f"Completed analyzing {total} reviews")
+    return results
+
+
+def batch_analyze_reviews_bulk(
+    reviews: list,
+    k: int = BULK_CHUNK_SIZE,
+    model: str = "llama-3.3-70b-versatile",
+    show_progress: bool = True,
+    max_workers: int = MAX_WORKERS,
+    cache_file: Optional[str] = None,
+    requests_per_minute: Optional[float] = REQUESTS_PER_MINUTE
+) -> list:
+    """
+    Analyze multiple reviews in batch, packing k reviews into each API call.
+    
+    Shorthand for batch_analyze_reviews(..., batch_size=k), so deduplication,
+    caching and rate limiting are exactly the same.
     
-    return results
\ No newline at end of file
+    Args:
+        reviews: List of review texts
+        k: Number of reviews per API call
+        model: The Groq model to use
+        show_progress: Whether to show progress indicators
+        max_workers: Maximum number of concurrent API calls
+        cache_file: Optional path to a JSON file caching previous analyses
+        requests_per_minute: Maximum rate of new API calls (None disables pacing)
+        
+    Returns:
+        List of dicts with sentiment and summary for each review
+    """
+    return batch_analyze_reviews(
+        reviews,
+        model=model,
+        show_progress=show_progress,
+        max_workers=max_workers,
+        cache_file=cache_file,
+        requests_per_minute=requests_per_minute,
+        batch_size=k
+    )
@@ -2,33 +2,97 @@
 Utility functions for Google Sheets connection and basic operations.
 """
 import os
+import re
+import functools
+import logging
+import math
+import numbers
+import threading
+import time
 import gspread
 from google.oauth2.service_account import Credentials
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from dotenv import load_dotenv
 import pandas as pd
 
-# Load environment variables
-load_dotenv()
+try:
+    import pyarrow  # noqa: F401 - only needed for pandas' Arrow-backed strings
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
-def get_google_sheets_client(credentials_file: str = "credentials.json") -> gspread.Client:
+logger = logging.getLogger(__name__)
+# Silent unless the application configures logging (main.py does)
+logger.addHandler(logging.NullHandler())
+
+# Whether the .env file has been loaded into the environment yet
+_env_loaded = False
+
+# Maximum number of cells sent to the Sheets API in a single write request
+MAX_CELLS_PER_REQUEST = 50_000
+
+# Approximate request body size, in characters, a single write request is kept
+# under (Google recommends Sheets API payloads of at most 2 MB)
+MAX_PAYLOAD_CHARS_PER_REQUEST = 2_000_000
+
+# Estimated JSON characters each cell adds on top of its own text, for the
+# nested {"userEnteredValue": {"stringValue": ...}} wrapper
+_CELL_JSON_OVERHEAD = 40
+
+# Maximum number of DataFrame rows converted for the Sheets API at a time
+CHUNK_ROWS = 10_000
+
+# Connection pooling and retries for the HTTP session shared by all Sheets
+# calls; only idempotent requests (GET, PUT, ...) are retried, never POSTs.
+# Once retries run out the last response is returned rather than raised, so
+# gspread still turns it into an APIError for the callers to handle
+_SHEETS_POOL_CONNECTIONS = 4
+_SHEETS_POOL_MAXSIZE = 10
+_SHEETS_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False
+)
+
+# Seconds a worksheet's protection status is reused before asking the API again
+PROTECTED_CACHE_TTL = 300.0
+
+# (spreadsheet ID, worksheet ID) -> (time checked, protected?)
+_PROTECTED_CACHE: Dict[Tuple[str, int], Tuple[float, bool]] = {}
+_PROTECTED_CACHE_LOCK = threading.Lock()
+
+# (spreadsheet ID, worksheet ID, engine, render option) -> (last update time, DataFrame)
+_READ_CACHE: Dict[Tuple[str, int, str, str], Tuple[str, Any]] = {}
+_READ_CACHE_LOCK = threading.Lock()
+
+# Runs of whitespace collapsed to a single space by clean_text
+_WS_RE = re.compile(r'\s+')
+
+
+# Guards the client/spreadsheet caches; re-entrant because opening a cached
+# spreadsheet goes through the cached client
+_SHEETS_CACHE_LOCK = threading.RLock()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_client(credentials_file: str) -> gspread.Client:
     """
-    Create and return an authenticated Google Sheets client.
+    Authenticate once per credentials file and cache the resulting client.
     
     Args:
         credentials_file: Path to the Google service account credentials JSON file
         
     Returns:
         gspread.Client: Authenticated client object
-        
-    Raises:
-        FileNotFoundError: If credentials file doesn't exist
-        Exception: If authentication fails
     """
-    if not os.path.exists(credentials_file):
-        raise FileNotFoundError(f"Credentials file '{credentials_file}' not found.")
-    
     # Define the required scopes
     scopes = [
         'https://www.googleapis.com/auth/spreadsheets',
@@ -39,13 +103,88 @@ def get_google_sheets_client(credentials_file: str = "credentials.json") -> gspr
     creds = Credentials.from_service_account_file(credentials_file, scopes=scopes)
     client = gspread.authorize(creds)
     
+    # Keep-alive connections are reused by every call made through this client
+    adapter = HTTPAdapter(
+        pool_connections=_SHEETS_POOL_CONNECTIONS,
+        pool_maxsize=_SHEETS_POOL_MAXSIZE,
+        max_retries=_SHEETS_RETRY
+    )
+    client.http_client.session.mount('https://', adapter)
+    
     return client
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_spreadsheet(sheet_id: str, credentials_file: str) -> gspread.Spreadsheet:
+    """
+    Open a spreadsheet once per (sheet ID, credentials file) and cache it.
+    
+    Args:
+        sheet_id: Google Sheets ID
+        credentials_file: Path to credentials file
+        
+    Returns:
+        gspread.Spreadsheet: The spreadsheet object
+    """
+    client = get_google_sheets_client(credentials_file)
+    return client.open_by_key(sheet_id)
+
+
+def _ensure_env() -> None:
+    """
+    Load environment variables from .env the first time they are needed.
+    
+    Returns:
+        None
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def clear_sheets_cache() -> None:
+    """
+    Forget all cached Google Sheets clients and spreadsheets.
+    
+    Returns:
+        None
+    """
+    with _SHEETS_CACHE_LOCK:
+        _cached_client.cache_clear()
+        _cached_spreadsheet.cache_clear()
+
+
+def get_google_sheets_client(credentials_file: str = "credentials.json") -> gspread.Client:
+    """
+    Return an authenticated Google Sheets client.
+    
+    The client is created once per credentials file and reused afterwards.
+    
+    Args:
+        credentials_file: Path to the Google service account credentials JSON file
+        
+    Returns:
+        gspread.Client: Authenticated client object
+        
+    Raises:
+        FileNotFoundError: If credentials file doesn't exist
+        Exception: If authentication fails
+    """
+    if not os.path.exists(credentials_file):
+        raise FileNotFoundError(f"Credentials file '{credentials_file}' not found.")
+    
+    with _SHEETS_CACHE_LOCK:
+        return _cached_client(credentials_file)
+
+
 def get_spreadsheet(sheet_id: Optional[str] = None, credentials_file: str = "credentials.json") -> gspread.Spreadsheet:
     """
     Get a specific Google Spreadsheet by ID.
     
+    The spreadsheet is opened once per (sheet ID, credentials file) and
+    reused by every later ETL stage.
+    
     Args:
         sheet_id: Google Sheets ID (from URL). If None, reads from env variable
         credentials_file: Path to credentials file
@@ -58,15 +197,14 @@ def get_spreadsheet(sheet_id: Optional[str] = None, credentials_file: str = "cre
         Exception: If spreadsheet cannot be accessed
     """
     if sheet_id is None:
+        _ensure_env()
         sheet_id = os.getenv('GOOGLE_SHEET_ID')
         
     if not sheet_id:
         raise ValueError("Sheet ID must be provided or set in GOOGLE_SHEET_ID environment variable")
     
-    client = get_google_sheets_client(credentials_file)
-    spreadsheet = client.open_by_key(sheet_id)
-    
-    return spreadsheet
+    with _SHEETS_CACHE_LOCK:
+        return _cached_spreadsheet(sheet_id, credentials_file)
 
 
 def get_worksheet(spreadsheet: gspread.Spreadsheet, worksheet_name: str) -> gspread.Worksheet:
@@ -106,29 +244,284 @@ def create_worksheet_if_not_exists(
     """
     try:
         worksheet = spreadsheet.worksheet(worksheet_name)
-        print(f"Worksheet '{worksheet_name}' already exists.")
+        logger.info("Worksheet '%s' already exists.", worksheet_name)
         return worksheet
     except gspread.exceptions.WorksheetNotFound:
         worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=rows, cols=cols)
-        print(f"Worksheet '{worksheet_name}' created successfully.")
+        logger.info("Worksheet '%s' created successfully.", worksheet_name)
         return worksheet
 
 
-def read_worksheet_to_dataframe(worksheet: gspread.Worksheet) -> pd.DataFrame:
+def clear_read_cache() -> None:
+    """
+    Forget all DataFrames cached by read_worksheet_to_dataframe.
+    
+    Returns:
+        None
+    """
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def read_worksheet_to_dataframe(
+    worksheet: gspread.Worksheet,
+    engine: str = "pandas",
+    use_cache: bool = False,
+    value_render_option: str = 'FORMATTED_VALUE'
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
+    """
+    Read all data from a worksheet into a DataFrame.
+    
+    The first row is used as the header. By default cells are read as
+    displayed and numeric-looking text is converted to numbers, like
+    get_all_records does. With value_render_option='UNFORMATTED_VALUE'
+    numbers arrive as numbers without that per-cell conversion, but dates,
+    percentages and currencies also come back as raw numbers (e.g. 45293
+    for 2024-01-02, 0.045 for 4.5%), so only use it for sheets without
+    such formatting. When pyarrow is installed, purely textual columns are
+    stored as Arrow-backed strings instead of Python objects.
+    
+    Args:
+        worksheet: The worksheet to read from
+        engine: 'pandas' (default) or 'polars'; polars must be installed
+            for the latter, and callers convert with .to_pandas() where
+            a pandas DataFrame is needed
+        use_cache: Reuse the previous read of this worksheet unless the
+            spreadsheet's last update time has changed since. The check is
+            one small metadata request instead of a full values download.
+        value_render_option: 'FORMATTED_VALUE' (default) or
+            'UNFORMATTED_VALUE', see above
+        
+    Returns:
+        pd.DataFrame or pl.DataFrame: DataFrame containing the worksheet data
+        
+    Raises:
+        ValueError: If engine is not 'pandas' or 'polars'
+        ImportError: If engine is 'polars' and polars is not installed
+    """
+    if engine not in ("pandas", "polars"):
+        raise ValueError(f"Unknown engine '{engine}', expected 'pandas' or 'polars'")
+    if engine == "polars" and pl is None:
+        raise ImportError("engine='polars' requires the polars package (pip install polars)")
+    
+    if not use_cache:
+        return _read_worksheet(worksheet, engine, value_render_option)
+    
+    key = (worksheet.spreadsheet.id, worksheet.id, engine, value_render_option)
+    revision = worksheet.spreadsheet.get_lastUpdateTime()
+    
+    with _READ_CACHE_LOCK:
+        cached = _READ_CACHE.get(key)
+    if cached is None or cached[0] != revision:
+        df = _read_worksheet(worksheet, engine, value_render_option)
+        cached = (revision, df)
+        with _READ_CACHE_LOCK:
+            _READ_CACHE[key] = cached
+    
+    df = cached[1]
+    # Callers get their own data so changes to it never leak into the cache
+    # (a shallow copy would share it on pandas 2.x without copy-on-write)
+    return df.copy() if isinstance(df, pd.DataFrame) else df.clone()
+
+
+def _read_worksheet(
+    worksheet: gspread.Worksheet,
+    engine: str,
+    value_render_option: str
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
+    """
+    Fetch a worksheet's values and build a DataFrame with the given engine.
+    
+    Args:
+        worksheet: The worksheet to read from
+        engine: 'pandas' or 'polars'
+        value_render_option: How the Sheets API renders cell values
+        
+    Returns:
+        pd.DataFrame or pl.DataFrame: DataFrame containing the worksheet data
+    """
+    rows = worksheet.get_all_values(value_render_option=value_render_option)
+    
+    if not rows:
+        return pl.DataFrame() if engine == "polars" else pd.DataFrame()
+    
+    header, *data = rows
+    data = _numericise_rows(data, value_render_option)
+    
+    if engine == "polars":
+        # Columns mixing numbers and blanks fall back to a common type
+        return pl.DataFrame(data, schema=header, orient='row', strict=False, infer_schema_length=None)
+    
+    df = pd.DataFrame(data, columns=header)
+    
+    return _use_arrow_strings(df)
+
+
+def read_worksheet_in_chunks(
+    worksheet: gspread.Worksheet,
+    chunk_rows: int = CHUNK_ROWS,
+    value_render_option: str = 'FORMATTED_VALUE'
+) -> Iterator[pd.DataFrame]:
     """
-    Read all data from a worksheet into a pandas DataFrame.
+    Read a worksheet as a sequence of DataFrames of at most chunk_rows rows.
+    
+    Only one chunk is fetched and held at a time, so memory stays bounded
+    by the chunk size rather than the sheet size. The first row is used as
+    the header of every chunk, and chunk indexes continue where the
+    previous chunk stopped, as in read_worksheet_to_dataframe. Reading
+    stops at the first empty range, since the grid (row_count, 1000 rows
+    for a new sheet) usually extends well past the data. Column types are
+    inferred from the first chunk and applied to every later one, so a
+    column does not switch between numbers and text from chunk to chunk.
     
     Args:
         worksheet: The worksheet to read from
+        chunk_rows: Maximum number of data rows per chunk
+        value_render_option: 'FORMATTED_VALUE' (default) or
+            'UNFORMATTED_VALUE', as in read_worksheet_to_dataframe
+        
+    Returns:
+        Iterator[pd.DataFrame]: DataFrames with the worksheet data
+    """
+    header = worksheet.row_values(1, value_render_option=value_render_option)
+    if not header:
+        return
+    
+    n_cols = len(header)
+    last_col = gspread.utils.rowcol_to_a1(1, n_cols)[:-1]
+    
+    dtypes = None
+    
+    for start in range(2, worksheet.row_count + 1, chunk_rows):
+        end = min(start + chunk_rows - 1, worksheet.row_count)
+        rows = worksheet.get(f'A{start}:{last_col}{end}', value_render_option=value_render_option)
+        if not rows:
+            break
+        
+        # The API trims trailing empty cells, so rows are padded to the header
+        data = [list(row) + [''] * (n_cols - len(row)) for row in rows]
+        index = range(start - 2, start - 2 + len(data))
+        
+        if dtypes is None:
+            df = pd.DataFrame(_numericise_rows(data, value_render_option), columns=header, index=index)
+            df = _use_arrow_strings(df)
+            dtypes = df.dtypes.tolist()
+        else:
+            df = pd.DataFrame(data, columns=header, index=index)
+            df = _apply_chunk_dtypes(df, dtypes, value_render_option)
+        
+        yield df
+
+
+def _apply_chunk_dtypes(
+    df: pd.DataFrame,
+    dtypes: List[Any],
+    value_render_option: str
+) -> pd.DataFrame:
+    """
+    Convert a later chunk's columns to the types of the first chunk.
+    
+    String columns are cast to their string dtype, so numeric-looking text
+    stays text. Other columns are numericised like the first chunk was, and
+    numeric ones are then converted to the first chunk's dtype; cells that
+    are not numbers there become NaN, and an integer column with such cells
+    becomes float.
+    
+    Args:
+        df: Chunk built from the padded rows, modified in place
+        dtypes: Column dtypes of the first chunk, by position
+        value_render_option: How the Sheets API rendered the values
         
     Returns:
-        pd.DataFrame: DataFrame containing the worksheet data
+        pd.DataFrame: The same DataFrame, for chaining
     """
-    data = worksheet.get_all_records()
-    df = pd.DataFrame(data)
+    for position, dtype in enumerate(dtypes):
+        values = df.iloc[:, position].tolist()
+        
+        if isinstance(dtype, pd.StringDtype):
+            column = pd.Series(values, index=df.index).astype(dtype)
+        else:
+            values = _numericise_rows([values], value_render_option)[0]
+            column = pd.Series(values, index=df.index, dtype=object)
+            
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                column = pd.to_numeric(column, errors='coerce')
+                try:
+                    column = column.astype(dtype)
+                except (TypeError, ValueError):
+                    column = column.astype('float64')
+        
+        df.isetitem(position, column)
+    
     return df
 
 
+def _numericise_rows(rows: List[List[Any]], value_render_option: str) -> List[List[Any]]:
+    """
+    Convert numeric-looking formatted cells to numbers, as get_all_records does.
+    
+    Unformatted values already arrive as numbers and are returned as they are.
+    
+    Args:
+        rows: Data rows read from a worksheet
+        value_render_option: How the Sheets API rendered the values
+        
+    Returns:
+        List[List[Any]]: Rows with numeric text converted to int or float
+    """
+    if value_render_option != 'FORMATTED_VALUE':
+        return rows
+    return [gspread.utils.numericise_all(row) for row in rows]
+
+
+def _use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store purely textual object columns as Arrow-backed strings.
+    
+    Does nothing unless pyarrow is installed. Columns mixing numbers and
+    text keep their values as they are.
+    
+    Args:
+        df: DataFrame read from a worksheet, modified in place
+        
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    if PYARROW_AVAILABLE:
+        for col in df.select_dtypes(include='object').columns:
+            if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+                df[col] = df[col].astype('string[pyarrow]')
+    
+    return df
+
+
+def _cell_data(value: Any) -> Dict[str, Any]:
+    """
+    Convert a Python value into a Sheets API CellData entry.
+    
+    Values are stored as-is (like RAW input): strings are never parsed into
+    numbers, dates or formulas, and '' produces an empty cell. Infinite and
+    NaN floats have no JSON number form, so they are stored as text.
+    
+    Args:
+        value: The value to store
+        
+    Returns:
+        Dict[str, Any]: CellData for an updateCells request
+    """
+    if value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, numbers.Integral):
+        return {'userEnteredValue': {'numberValue': int(value)}}
+    if isinstance(value, numbers.Real):
+        if not math.isfinite(value):
+            return {'userEnteredValue': {'stringValue': str(value)}}
+        return {'userEnteredValue': {'numberValue': float(value)}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
 def write_dataframe_to_worksheet(
     worksheet: gspread.Worksheet,
     df: pd.DataFrame,
@@ -137,6 +530,15 @@ def write_dataframe_to_worksheet(
     """
     Write a pandas DataFrame to a worksheet.
     
+    Rows are converted in chunks of at most CHUNK_ROWS rows, so only the
+    chunks of the request being built are held as Python lists. Clearing the
+    sheet, growing it if needed and writing the rows are grouped into as few
+    spreadsheets.batchUpdate requests as the limits allow: each request
+    carries at most MAX_CELLS_PER_REQUEST cells and roughly
+    MAX_PAYLOAD_CHARS_PER_REQUEST characters of JSON (cell text plus
+    _CELL_JSON_OVERHEAD per cell), so long review text splits a write into
+    more requests. Typical sheets are written with a single request.
+    
     Args:
         worksheet: The worksheet to write to
         df: DataFrame to write
@@ -145,21 +547,108 @@ def write_dataframe_to_worksheet(
     Returns:
         None
     """
+    n_cols = max(1, len(df.columns))
+    chunk_rows = max(1, min(CHUNK_ROWS, MAX_CELLS_PER_REQUEST // n_cols))
+    
+    requests = []
+    
     if clear_first:
-        worksheet.clear()
+        # Clears cell values only, like worksheet.clear()
+        requests.append({
+            'updateCells': {
+                'range': {'sheetId': worksheet.id},
+                'fields': 'userEnteredValue'
+            }
+        })
     
-    # Convert DataFrame to list of lists (including headers)
-    values = [df.columns.tolist()] + df.fillna('').values.tolist()
+    # Unlike the values API, updateCells does not grow the grid by itself
+    for dimension, needed, available in (
+        ('ROWS', len(df) + 1, worksheet.row_count),
+        ('COLUMNS', len(df.columns), worksheet.col_count)
+    ):
+        if needed > available:
+            requests.append({
+                'appendDimension': {
+                    'sheetId': worksheet.id,
+                    'dimension': dimension,
+                    'length': needed - available
+                }
+            })
+    
+    def update_cells(row_index: int, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'updateCells': {
+                'start': {'sheetId': worksheet.id, 'rowIndex': row_index, 'columnIndex': 0},
+                'rows': rows,
+                'fields': 'userEnteredValue'
+            }
+        }
+    
+    pending_cells = 0
+    pending_chars = 0
+    
+    # The header row goes out with the first chunk; an empty frame still
+    # writes its header
+    for start in range(0, max(len(df), 1), chunk_rows):
+        # The header row is prepended by extending a one-row list rather
+        # than inserting at the front, which would shift every chunk row
+        values = [df.columns.tolist()] if start == 0 else []
+        row_index = start + 1 - len(values)
+        
+        # Converting through an object array turns categorical and other
+        # typed columns back into plain values at the I/O boundary
+        values.extend(df.iloc[start:start + chunk_rows].to_numpy(dtype=object, na_value='').tolist())
+        
+        rows = []
+        for row in values:
+            row_cells = len(row)
+            row_chars = sum(len(str(value)) for value in row) + _CELL_JSON_OVERHEAD * row_cells
+            
+            # Send what is pending before this row would push the request
+            # over either limit; a single oversized row still goes out alone
+            if pending_cells and (
+                pending_cells + row_cells > MAX_CELLS_PER_REQUEST
+                or pending_chars + row_chars > MAX_PAYLOAD_CHARS_PER_REQUEST
+            ):
+                if rows:
+                    requests.append(update_cells(row_index, rows))
+                    row_index += len(rows)
+                    rows = []
+                worksheet.spreadsheet.batch_update({'requests': requests})
+                requests = []
+                pending_cells = 0
+                pending_chars = 0
+            
+            rows.append({'values': [_cell_data(value) for value in row]})
+            pending_cells += row_cells
+            pending_chars += row_chars
+        
+        if rows:
+            requests.append(update_cells(row_index, rows))
+    
+    worksheet.spreadsheet.batch_update({'requests': requests})
     
-    # Update the worksheet
-    worksheet.update(values, 'A1')
     print(f"✓ Written {len(df)} rows to worksheet '{worksheet.title}'")
 
 
+def clear_protected_cache() -> None:
+    """
+    Forget all cached worksheet protection statuses.
+    
+    Returns:
+        None
+    """
+    with _PROTECTED_CACHE_LOCK:
+        _PROTECTED_CACHE.clear()
+
+
 def is_worksheet_protected(worksheet: gspread.Worksheet) -> bool:
     """
     Check if a worksheet is protected.
     
+    Protection rarely changes, so a successful lookup is reused for
+    PROTECTED_CACHE_TTL seconds instead of calling the API on every extract.
+    
     Args:
         worksheet: The worksheet to check
         
@@ -167,10 +656,21 @@ def is_worksheet_protected(worksheet: gspread.Worksheet) -> bool:
         bool: True if protected, False otherwise
     """
     try:
-        # Try to get protected ranges
         spreadsheet = worksheet.spreadsheet
+        key = (spreadsheet.id, worksheet.id)
+        
+        with _PROTECTED_CACHE_LOCK:
+            cached = _PROTECTED_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < PROTECTED_CACHE_TTL:
+            return cached[1]
+        
+        # Try to get protected ranges
         protected_ranges = spreadsheet.list_protected_ranges(worksheet.id)
-        return len(protected_ranges) > 0
+        protected = len(protected_ranges) > 0
+        
+        with _PROTECTED_CACHE_LOCK:
+            _PROTECTED_CACHE[key] = (time.monotonic(), protected)
+        return protected
     except Exception:
         return False
 
@@ -185,16 +685,59 @@ def clean_text(text: Any) -> str:
     Returns:
         str: Cleaned text
     """
-    if pd.isna(text) or text == '' or text is None:
+    # Missing values (None, pd.NA, NaN - the only value not equal to itself)
+    if text is None or text is pd.NA or text != text:
         return ''
     
-    # Convert to string and strip whitespace
-    text = str(text).strip()
+    # Strip and collapse extra whitespace
+    return _WS_RE.sub(' ', str(text).strip())
+
+
+def clean_text_series(series: pd.Series) -> pd.Series:
+    """
+    Clean and standardize a whole column of text data.
+    
+    Vectorized equivalent of clean_text: values are converted to strings,
+    stripped and have repeated whitespace collapsed, with missing values
+    becoming empty strings.
     
-    # Remove extra whitespace
-    text = ' '.join(text.split())
+    Columns that already have a string dtype keep it, so Arrow-backed
+    columns from _use_arrow_strings stay Arrow-backed; other columns become
+    Arrow-backed strings when pyarrow is installed.
     
-    return text
+    Args:
+        series: Column to clean
+        
+    Returns:
+        pd.Series: Cleaned column with string dtype
+    """
+    if not isinstance(series.dtype, pd.StringDtype):
+        series = series.astype('string[pyarrow]' if PYARROW_AVAILABLE else 'string')
+    
+    return (
+        series
+        .str.strip()
+        .str.replace(r'\s+', ' ', regex=True)
+        .fillna('')
+    )
+
+
+def downcast_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast integer columns to the smallest integer dtype that fits.
+    
+    Columns are modified in place; float and text columns are left as is.
+    
+    Args:
+        df: DataFrame to optimize
+        
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    return df
 
 
 def validate_dataframe_columns(df: pd.DataFrame, required_columns: List[str]) -> bool:
@@ -208,10 +751,12 @@ def validate_dataframe_columns(df: pd.DataFrame, required_columns: List[str]) ->
     Returns:
         bool: True if all columns present, False otherwise
     """
-    missing_columns = set(required_columns) - set(df.columns)
+    # Hash the frame's columns once; the list keeps the required order
+    present = frozenset(df.columns)
+    missing_columns = [col for col in required_columns if col not in present]
     
     if missing_columns:
-        print(f"Missing required columns: {missing_columns}")
+        logger.warning("Missing required columns: %s", missing_columns)
         return False
     
     return True
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures for the test suite.
+
+Module-scoped fixtures are built once per test module; tests must treat them
+as read-only and take a .copy() before modifying them.
+"""
+import pytest
+import pandas as pd
+from src.analysis import clear_report_cache
+from src.llm_analysis import clear_groq_client_cache
+from src.utils import clear_sheets_cache, clear_protected_cache, clear_read_cache
+
+
+def _clear_caches() -> None:
+    """Empty every module-level cache the code under test keeps."""
+    clear_sheets_cache()
+    clear_protected_cache()
+    clear_read_cache()
+    clear_groq_client_cache()
+    clear_report_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_caches(monkeypatch):
+    """
+    Start and end every test without cached Sheets clients, spreadsheets,
+    reads, Groq client or reports, so results do not depend on test order.
+    """
+    # .env is only read lazily, by get_spreadsheet and the Groq client;
+    # marking it as loaded keeps a local .env out of the tests, so patched
+    # os.environ is all they see
+    monkeypatch.setattr('src.utils._env_loaded', True)
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+@pytest.fixture(scope='module')
+def sample_sentiment_df():
+    """Processed reviews for two classes: Dress (1 positive, 1 negative) and Pants (2 positive, 1 neutral)."""
+    return pd.DataFrame({
+        'Class Name': ['Dress', 'Dress', 'Pants', 'Pants', 'Pants'],
+        'AI Sentiment': ['Positive', 'Negative', 'Positive', 'Positive', 'Neutral']
+    })
+
+
+@pytest.fixture(scope='module')
+def sample_report_dict():
+    """Minimal analysis report holding a sentiment breakdown by class."""
+    return {
+        'by_class': pd.DataFrame({
+            'Class Name': ['Dress', 'Pants'],
+            'AI Sentiment': ['Positive', 'Negative'],
+            'percentage': [70.0, 30.0]
+        })
+    }
@@ -9,21 +9,18 @@ from src.analysis import (
     get_top_sentiment_classes,
     generate_sentiment_analysis_report,
     create_sentiment_visualizations,
-    export_analysis_to_csv
+    export_analysis_to_csv,
+    export_analysis_to_parquet,
+    _sentiment_stats
 )
 
 
 class TestCalculateSentimentByClass:
     """Tests for calculate_sentiment_by_class function."""
     
-    def test_calculate_with_valid_data(self):
+    def test_calculate_with_valid_data(self, sample_sentiment_df):
         """Test calculating sentiment distribution by class."""
-        df = pd.DataFrame({
-            'Class Name': ['Dress', 'Dress', 'Pants', 'Pants', 'Pants'],
-            'AI Sentiment': ['Positive', 'Negative', 'Positive', 'Positive', 'Neutral']
-        })
-        
-        result = calculate_sentiment_by_class(df)
+        result = calculate_sentiment_by_class(sample_sentiment_df)
         
         assert isinstance(result, pd.DataFrame)
         assert 'Class Name' in result.columns
@@ -32,45 +29,62 @@ class TestCalculateSentimentByClass:
         assert 'percentage' in result.columns
         assert len(result) > 0
     
-    def test_calculate_filters_empty_sentiments(self):
+    def test_calculate_filters_empty_sentiments(self, sample_sentiment_df):
         """Test that empty sentiments are filtered out."""
-        df = pd.DataFrame({
-            'Class Name': ['Dress', 'Dress', 'Pants'],
-            'AI Sentiment': ['Positive', '', 'Negative']
-        })
+        df = sample_sentiment_df.copy()
+        df.loc[1, 'AI Sentiment'] = ''
         
         result = calculate_sentiment_by_class(df)
         
-        # Should only have 2 records (empty sentiment filtered out)
-        assert len(result) == 2
+        # Dress/Positive, Pants/Positive and Pants/Neutral (empty sentiment filtered out)
+        assert len(result) == 3
+        assert '' not in result['AI Sentiment'].tolist()
     
-    def test_calculate_percentages_correct(self):
+    def test_calculate_percentages_correct(self, sample_sentiment_df):
         """Test that percentages are calculated correctly."""
-        df = pd.DataFrame({
-            'Class Name': ['Dress', 'Dress', 'Dress', 'Dress'],
-            'AI Sentiment': ['Positive', 'Positive', 'Negative', 'Neutral']
-        })
-        
-        result = calculate_sentiment_by_class(df)
+        result = calculate_sentiment_by_class(sample_sentiment_df)
         
         # Get the positive sentiment for Dress
         positive_row = result[(result['Class Name'] == 'Dress') & 
                              (result['AI Sentiment'] == 'Positive')]
         
         assert len(positive_row) == 1
-        assert positive_row['percentage'].iloc[0] == 50.0  # 2 out of 4
+        assert positive_row['percentage'].iloc[0] == 50.0  # 1 out of 2
     
-    def test_calculate_with_single_class(self):
+    def test_calculate_with_single_class(self, sample_sentiment_df):
         """Test calculation with single class."""
-        df = pd.DataFrame({
-            'Class Name': ['Dress', 'Dress', 'Dress'],
-            'AI Sentiment': ['Positive', 'Positive', 'Negative']
-        })
+        df = sample_sentiment_df[sample_sentiment_df['Class Name'] == 'Dress']
         
         result = calculate_sentiment_by_class(df)
         
-        assert 'Dress' in result['Class Name'].values
-        assert len(result) > 0
+        assert result['Class Name'].unique().tolist() == ['Dress']
+        assert result['percentage'].sum() == 100.0
+    
+    def test_calculate_totals_per_class(self, sample_sentiment_df):
+        """Test that each row carries the total for its class."""
+        result = calculate_sentiment_by_class(sample_sentiment_df)
+        
+        totals = dict(zip(result['Class Name'], result['total']))
+        assert totals == {'Dress': 2, 'Pants': 3}
+        pants_positive = result[(result['Class Name'] == 'Pants') & (result['AI Sentiment'] == 'Positive')]
+        assert pants_positive['percentage'].iloc[0] == 66.67
+    
+    def test_calculate_uses_categorical_keys(self, sample_sentiment_df):
+        """Test that grouping keys are categorical and classes without valid sentiment are dropped."""
+        df = sample_sentiment_df.copy()
+        # Pants keeps only empty sentiments
+        df['AI Sentiment'] = pd.Categorical(
+            df['AI Sentiment'].where(df['Class Name'] == 'Dress', ''),
+            categories=['Positive', 'Negative', 'Neutral', '']
+        )
+        
+        result = calculate_sentiment_by_class(df)
+        
+        assert isinstance(result['Class Name'].dtype, pd.CategoricalDtype)
+        assert isinstance(result['AI Sentiment'].dtype, pd.CategoricalDtype)
+        assert result['Class Name'].tolist() == ['Dress', 'Dress']
+        # The input frame is not modified
+        assert not isinstance(df['Class Name'].dtype, pd.CategoricalDtype)
 
 
 class TestGetTopSentimentClasses:
@@ -127,6 +141,20 @@ class TestGetTopSentimentClasses:
         
         assert class_name == 'Pants'
         assert percentage == 40.0
+    
+    def test_get_top_tie_returns_first_class(self):
+        """Test that ties go to the first class listed."""
+        sentiment_stats = pd.DataFrame({
+            'Class Name': ['Dress', 'Pants', 'Shirt'],
+            'AI Sentiment': ['Neutral', 'Positive', 'Positive'],
+            'percentage': [90.0, 50.0, 50.0]
+        }, index=[10, 20, 30])
+        
+        class_name, percentage = get_top_sentiment_classes(sentiment_stats, 'Positive')
+        
+        assert class_name == 'Pants'
+        assert percentage == 50.0
+        assert isinstance(percentage, float)
 
 
 class TestGenerateSentimentAnalysisReport:
@@ -163,6 +191,20 @@ class TestGenerateSentimentAnalysisReport:
         assert report['overall_sentiment']['negative'] == 20.0
         assert report['overall_sentiment']['neutral'] == 10.0
     
+    def test_generate_report_missing_sentiment_is_zero(self):
+        """Test that sentiments with no reviews report 0%."""
+        df = pd.DataFrame({
+            'Class Name': ['Dress', 'Pants', 'Pants'],
+            'AI Sentiment': ['Positive', 'Positive', '']
+        })
+        
+        report = generate_sentiment_analysis_report(df)
+        
+        assert report['overall_sentiment']['total_reviews'] == 2
+        assert report['overall_sentiment']['positive'] == 100.0
+        assert report['overall_sentiment']['negative'] == 0.0
+        assert report['overall_sentiment']['neutral'] == 0.0
+    
     def test_generate_report_top_classes(self):
         """Test that top classes are identified correctly."""
         df = pd.DataFrame({
@@ -187,6 +229,58 @@ class TestGenerateSentimentAnalysisReport:
         
         assert report['overall_sentiment']['total_reviews'] == 1
         assert isinstance(report['by_class'], pd.DataFrame)
+    
+    @patch('src.analysis._sentiment_stats', wraps=_sentiment_stats)
+    def test_generate_report_is_cached(self, mock_stats):
+        """Test that unchanged data reuses the cached report."""
+        df = pd.DataFrame({
+            'Class Name': ['Dress', 'Pants'],
+            'AI Sentiment': ['Positive', 'Negative'],
+            'Review Text': ['Nice', 'Bad']
+        })
+        
+        first = generate_sentiment_analysis_report(df)
+        # Same keys in a fresh frame, with an unrelated column changed
+        second = generate_sentiment_analysis_report(df.assign(**{'Review Text': ['a', 'b']}))
+        
+        assert second is not first
+        assert second['overall_sentiment'] == first['overall_sentiment']
+        assert second['top_classes'] == first['top_classes']
+        pd.testing.assert_frame_equal(second['by_class'], first['by_class'])
+        mock_stats.assert_called_once()
+    
+    def test_generate_report_cache_hands_out_copies(self, capsys):
+        """Test that editing a returned report leaves later reports untouched."""
+        df = pd.DataFrame({
+            'Class Name': ['Dress', 'Pants'],
+            'AI Sentiment': ['Positive', 'Negative']
+        })
+        
+        first = generate_sentiment_analysis_report(df)
+        first['by_class']['count'] = 0
+        first['top_classes'].pop('highest_positive')
+        capsys.readouterr()
+        second = generate_sentiment_analysis_report(df)
+        
+        assert second['by_class']['count'].tolist() == [1, 1]
+        assert 'highest_positive' in second['top_classes']
+        # A cached report is still printed
+        assert "Overall Sentiment Distribution" in capsys.readouterr().out
+    
+    @patch('src.analysis._sentiment_stats', wraps=_sentiment_stats)
+    def test_generate_report_recomputes_on_changed_data(self, mock_stats):
+        """Test that changed sentiments produce a new report."""
+        df = pd.DataFrame({
+            'Class Name': ['Dress', 'Pants'],
+            'AI Sentiment': ['Positive', 'Negative']
+        })
+        
+        first = generate_sentiment_analysis_report(df)
+        second = generate_sentiment_analysis_report(df.assign(**{'AI Sentiment': ['Negative', 'Negative']}))
+        
+        assert second['overall_sentiment']['negative'] == 100.0
+        assert first['overall_sentiment']['negative'] == 50.0
+        assert mock_stats.call_count == 2
 
 
 class TestCreateSentimentVisualizations:
@@ -258,17 +352,9 @@ class TestExportAnalysisToCSV:
     """Tests for export_analysis_to_csv function."""
     
     @patch('pandas.DataFrame.to_csv')
-    def test_export_to_csv(self, mock_to_csv):
+    def test_export_to_csv(self, mock_to_csv, sample_report_dict):
         """Test exporting analysis to CSV."""
-        report = {
-            'by_class': pd.DataFrame({
-                'Class Name': ['Dress', 'Pants'],
-                'AI Sentiment': ['Positive', 'Negative'],
-                'percentage': [70.0, 30.0]
-            })
-        }
-        
-        result = export_analysis_to_csv(report, 'test_output.csv')
+        result = export_analysis_to_csv(sample_report_dict, 'test_output.csv')
         
         assert result == 'test_output.csv'
         mock_to_csv.assert_called_once_with('test_output.csv', index=False)
@@ -287,4 +373,18 @@ class TestExportAnalysisToCSV:
         result = export_analysis_to_csv(report)
         
         assert 'sentiment_analysis_report.csv' in result
-        mock_to_csv.assert_called_once()
\ No newline at end of file
+        mock_to_csv.assert_called_once()
+
+
+class TestExportAnalysisToParquet:
+    """Tests for export_analysis_to_parquet function."""
+    
+    @patch('pandas.DataFrame.to_parquet')
+    def test_export_to_parquet(self, mock_to_parquet, sample_report_dict):
+        """Test exporting analysis to Parquet."""
+        result = export_analysis_to_parquet(sample_report_dict, 'test_output.parquet')
+        
+        assert result == 'test_output.parquet'
+        mock_to_parquet.assert_called_once_with(
+            'test_output.parquet', engine='pyarrow', compression='zstd', index=False
+        )
@@ -8,6 +8,7 @@ from src.etl import (
     transform_staging_data,
     prepare_processed_dataframe,
     extract_raw_data,
+    extract_raw_data_chunks,
     load_staging_data,
     extract_staging_data,
     load_processed_data
@@ -68,6 +69,31 @@ class TestTransformStagingData:
         assert len(result) == 2
         assert result['Number'].iloc[0] == 123
         assert result['Float'].iloc[1] == 2.5
+    
+    def test_transform_does_not_modify_original(self):
+        """Test that the input DataFrame is left unchanged."""
+        df = pd.DataFrame({
+            'Text': ['  Hello  ', 'World'],
+            'Number': [1, 2]
+        })
+        
+        transform_staging_data(df)
+        
+        assert df['Text'].tolist() == ['  Hello  ', 'World']
+    
+    def test_transform_keeps_arrow_strings(self):
+        """Test that Arrow-backed text columns stay Arrow-backed after cleaning."""
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame({
+            'Title': pd.Series(['  Great  ', 'Nice'], dtype='string[pyarrow]'),
+            'Review Text': pd.Series(['Love  it', ''], dtype='string[pyarrow]')
+        })
+        
+        result = transform_staging_data(df)
+        
+        assert result['Title'].dtype == 'string[pyarrow]'
+        assert result['Review Text'].dtype == 'string[pyarrow]'
+        assert result['Title'].tolist() == ['Great', 'Nice']
 
 
 class TestPrepareProcessedDataframe:
@@ -173,6 +199,23 @@ class TestExtractRawData:
         
         captured = capsys.readouterr()
         assert "not protected" in captured.out
+    
+    @patch('src.etl.get_spreadsheet')
+    @patch('src.etl.get_worksheet')
+    @patch('src.etl.read_worksheet_in_chunks')
+    @patch('src.etl.is_worksheet_protected')
+    def test_extract_raw_data_chunks(self, mock_protected, mock_read_chunks, mock_get_ws, mock_get_ss, capsys):
+        """Test streaming raw data extraction in chunks."""
+        mock_get_ss.return_value = Mock()
+        mock_get_ws.return_value = Mock()
+        mock_protected.return_value = True
+        mock_read_chunks.return_value = iter([pd.DataFrame({'A': [1, 2]}), pd.DataFrame({'A': [3]})])
+        
+        chunks = list(extract_raw_data_chunks('test_sheet_id', chunk_rows=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert mock_read_chunks.call_args.args[1] == 2
+        assert "Extracted 3 rows" in capsys.readouterr().out
 
 
 class TestLoadStagingData:
@@ -288,8 +331,8 @@ class TestRunETLPipeline:
         mock_transform.return_value = mock_df
         mock_prep.return_value = mock_df
         mock_batch.return_value = [
-            {'sentiment': 'Positive', 'summary': 'Great', 'action_needed': 'No'},
-            {'sentiment': 'Negative', 'summary': 'Bad', 'action_needed': 'Yes'}
+            {'sentiment': 'Positive', 'summary': 'Great'},
+            {'sentiment': 'Negative', 'summary': 'Bad'}
         ]
         
         # Execute
@@ -297,4 +340,59 @@ class TestRunETLPipeline:
         
         # Verify
         assert isinstance(result, pd.DataFrame)
-        mock_batch.assert_called_once()
\ No newline at end of file
+        mock_batch.assert_called_once()
+        assert isinstance(result['AI Sentiment'].dtype, pd.CategoricalDtype)
+        assert result['AI Sentiment'].tolist() == ['Positive', 'Negative']
+        assert result['Action Needed?'].tolist() == ['No', 'Yes']
+        assert isinstance(result['Action Needed?'].dtype, pd.CategoricalDtype)
+    
+    @patch('src.etl.extract_raw_data')
+    @patch('src.etl.transform_staging_data')
+    @patch('src.etl.load_staging_data')
+    @patch('src.etl.prepare_processed_dataframe')
+    @patch('src.etl.load_processed_data')
+    @patch('src.etl.batch_analyze_reviews')
+    def test_run_etl_skips_empty_reviews(self, mock_batch, mock_load_proc, mock_prep,
+                                         mock_load_stage, mock_transform, mock_extract):
+        """Test that empty reviews are not sent to the LLM."""
+        from src.etl import run_etl_pipeline
+        
+        mock_df = pd.DataFrame({'Review Text': ['Great!', '', '   ', 'Bad!']})
+        mock_extract.return_value = mock_df
+        mock_transform.return_value = mock_df
+        mock_prep.return_value = mock_df
+        mock_batch.return_value = [
+            {'sentiment': 'Positive', 'summary': 'Great'},
+            {'sentiment': 'Negative', 'summary': 'Bad'}
+        ]
+        
+        result = run_etl_pipeline(run_llm_analysis=True)
+        
+        assert mock_batch.call_args.args[0] == ['Great!', 'Bad!']
+        assert result['AI Sentiment'].tolist() == ['Positive', '', '', 'Negative']
+        assert result['AI Summary'].tolist() == ['Great', '', '', 'Bad']
+        assert result['Action Needed?'].tolist() == ['No', 'No', 'No', 'Yes']
+    
+    @patch('src.etl.extract_raw_data')
+    @patch('src.etl.transform_staging_data')
+    @patch('src.etl.load_staging_data')
+    @patch('src.etl.prepare_processed_dataframe')
+    @patch('src.etl.load_processed_data')
+    @patch('src.etl.batch_analyze_reviews')
+    def test_run_etl_staging_failure_stops_processed_load(self, mock_batch, mock_load_proc, mock_prep,
+                                                          mock_load_stage, mock_transform, mock_extract):
+        """Test that a failed background staging load is raised before processed is written."""
+        from src.etl import run_etl_pipeline
+        
+        mock_df = pd.DataFrame({'Review Text': ['Great!']})
+        mock_extract.return_value = mock_df
+        mock_transform.return_value = mock_df
+        mock_prep.return_value = mock_df
+        mock_batch.return_value = [{'sentiment': 'Positive', 'summary': 'Great'}]
+        mock_load_stage.side_effect = RuntimeError("quota exceeded")
+        
+        with pytest.raises(RuntimeError):
+            run_etl_pipeline(run_llm_analysis=True)
+        
+        mock_batch.assert_called_once()
+        mock_load_proc.assert_not_called()
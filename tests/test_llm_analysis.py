@@ -1,17 +1,29 @@
 """
 Unit tests for src/llm_analysis.py
 """
+import asyncio
+import httpx
 import pytest
+from groq import APIConnectionError, AuthenticationError, RateLimitError
 from unittest.mock import Mock, patch, MagicMock
 from src.llm_analysis import (
     get_groq_client,
     parse_llm_response,
     determine_action_needed,
     analyze_review_with_llm,
-    batch_analyze_reviews
+    batch_analyze_reviews,
+    batch_analyze_reviews_async,
+    analyze_reviews_chunk_with_llm,
+    batch_analyze_reviews_bulk,
+    _RateLimiter
 )
 
 
+def _connection_error():
+    """Build a transient Groq connection error."""
+    return APIConnectionError(request=httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions"))
+
+
 class TestGetGroqClient:
     """Tests for get_groq_client function."""
     
@@ -25,13 +37,45 @@ class TestGetGroqClient:
         client = get_groq_client()
         
         assert client == mock_client
-        mock_groq.assert_called_once_with(api_key='test_key')
+        mock_groq.assert_called_once_with(api_key='test_key', timeout=20.0, max_retries=0)
+    
+    @patch.dict('os.environ', {'GROQ_API_KEY': 'test_key'})
+    @patch('src.llm_analysis.Groq')
+    def test_get_client_is_reused(self, mock_groq):
+        """Test that the client is created once and then reused."""
+        first = get_groq_client()
+        second = get_groq_client()
+        
+        assert first is second
+        mock_groq.assert_called_once()
     
     @patch.dict('os.environ', {}, clear=True)
     def test_get_client_without_api_key(self):
         """Test that missing API key raises error."""
         with pytest.raises(ValueError, match="GROQ_API_KEY not found"):
             get_groq_client()
+    
+    @patch.dict('os.environ', {'GROQ_API_KEY': 'test_key'})
+    @patch('src.utils.load_dotenv')
+    @patch('src.llm_analysis.Groq')
+    def test_get_client_loads_env_lazily(self, mock_groq, mock_load_dotenv, monkeypatch):
+        """Test that .env is read when the client is first created, not at import."""
+        monkeypatch.setattr('src.utils._env_loaded', False)
+        
+        get_groq_client()
+        get_groq_client()
+        
+        mock_load_dotenv.assert_called_once()
+    
+    @patch('src.llm_analysis.Groq')
+    def test_failed_lookup_is_not_cached(self, mock_groq):
+        """Test that a missing key is not remembered once it is set."""
+        with patch.dict('os.environ', {}, clear=True):
+            with pytest.raises(ValueError):
+                get_groq_client()
+        
+        with patch.dict('os.environ', {'GROQ_API_KEY': 'test_key'}):
+            assert get_groq_client() is mock_groq.return_value
 
 
 class TestParseLLMResponse:
@@ -76,6 +120,16 @@ class TestParseLLMResponse:
         
         assert sentiment == "Positive"
     
+    def test_parse_padded_values(self):
+        """Test that whitespace around values and CRLF endings are stripped."""
+        response = "  Sentiment:   Negative \r\nSummary:\t Too small.   \r\n"
+        original = "Tiny"
+        
+        sentiment, summary = parse_llm_response(response, original)
+        
+        assert sentiment == "Negative"
+        assert summary == "Too small."
+    
     def test_parse_missing_sentiment(self):
         """Test parsing when sentiment is missing."""
         response = "Summary: Some summary text."
@@ -113,6 +167,16 @@ class TestParseLLMResponse:
         sentiment, summary = parse_llm_response(response, original)
         
         assert sentiment == "Neutral"  # Default for invalid
+    
+    def test_parse_case_insensitive_labels_and_crlf(self):
+        """Test parsing labels in any case with Windows line endings."""
+        response = "sentiment: NEGATIVE\r\nsummary: Runs small.\r\n"
+        original = "Review"
+        
+        sentiment, summary = parse_llm_response(response, original)
+        
+        assert sentiment == "Negative"
+        assert summary == "Runs small."
 
 
 class TestDetermineActionNeeded:
@@ -184,8 +248,8 @@ class TestAnalyzeReviewWithLLM:
         
         # Fail twice, then succeed
         mock_client.chat.completions.create.side_effect = [
-            Exception("API Error"),
-            Exception("API Error"),
+            _connection_error(),
+            _connection_error(),
             Mock(choices=[Mock(message=Mock(content="Sentiment: Positive\nSummary: Good"))])
         ]
         
@@ -197,16 +261,129 @@ class TestAnalyzeReviewWithLLM:
         assert mock_client.chat.completions.create.call_count == 3
     
     @patch('src.llm_analysis.get_groq_client')
-    def test_analyze_max_retries_exceeded(self, mock_get_client):
+    @patch('src.llm_analysis.time.sleep')
+    def test_analyze_retries_take_limiter_slots(self, mock_sleep, mock_get_client):
+        """Test that every retry waits for a rate limit slot before resending."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            _connection_error(),
+            _connection_error(),
+            Mock(choices=[Mock(message=Mock(content="Sentiment: Positive\nSummary: Good"))])
+        ]
+        mock_get_client.return_value = mock_client
+        limiter = Mock()
+        
+        analyze_review_with_llm("Test review", max_retries=3, limiter=limiter)
+        
+        assert limiter.acquire.call_count == 2
+    
+    @patch('src.llm_analysis.get_groq_client')
+    @patch('src.llm_analysis.time.sleep')
+    def test_analyze_honors_retry_after(self, mock_sleep, mock_get_client):
+        """Test that rate limit retries wait for the Retry-After delay."""
+        request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+        rate_limited = RateLimitError(
+            "Rate limited",
+            response=httpx.Response(429, headers={"retry-after": "7"}, request=request),
+            body=None
+        )
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            rate_limited,
+            Mock(choices=[Mock(message=Mock(content="Sentiment: Neutral\nSummary: Fine"))])
+        ]
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_review_with_llm("Test review", max_retries=2)
+        
+        assert result['sentiment'] == 'Neutral'
+        mock_sleep.assert_called_once_with(7.0)
+    
+    @patch('src.llm_analysis.get_groq_client')
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.random.uniform', return_value=0.25)
+    def test_analyze_backoff_grows_exponentially(self, mock_uniform, mock_sleep, mock_get_client):
+        """Test that other transient errors use jittered exponential backoff."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = _connection_error()
+        mock_get_client.return_value = mock_client
+        
+        analyze_review_with_llm("Test review", max_retries=3)
+        
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 1), (0, 2)]
+        assert mock_sleep.call_count == 2
+    
+    @patch('src.llm_analysis.get_groq_client')
+    @patch('src.llm_analysis.time.sleep')
+    def test_analyze_max_retries_exceeded(self, mock_sleep, mock_get_client):
         """Test that analysis returns error after max retries."""
         mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        mock_client.chat.completions.create.side_effect = _connection_error()
         mock_get_client.return_value = mock_client
         
         result = analyze_review_with_llm("Test review", max_retries=2)
         
         assert result['sentiment'] == 'Error'
         assert result['summary'] == 'Failed to analyze'
+        assert mock_client.chat.completions.create.call_count == 2
+    
+    @patch('src.llm_analysis.get_groq_client')
+    @patch('src.llm_analysis.time.sleep')
+    def test_analyze_does_not_retry_permanent_errors(self, mock_sleep, mock_get_client):
+        """Test that non-transient errors fail the review without retrying."""
+        request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = AuthenticationError(
+            "Invalid API key",
+            response=httpx.Response(401, request=request),
+            body=None
+        )
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_review_with_llm("Test review", max_retries=3)
+        
+        assert result['sentiment'] == 'Error'
+        mock_client.chat.completions.create.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    @patch('src.llm_analysis.get_groq_client')
+    def test_analyze_bounds_tokens_and_time(self, mock_get_client):
+        """Test that every call caps output tokens and sets a timeout."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Sentiment: Positive\nSummary: Good"))]
+        )
+        mock_get_client.return_value = mock_client
+        
+        analyze_review_with_llm("Test review")
+        
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs['max_tokens'] == 150
+        assert kwargs['timeout'] == 20.0
+        assert kwargs['stream'] is True
+    
+    @patch('src.llm_analysis.get_groq_client')
+    def test_analyze_streamed_response_stops_early(self, mock_get_client):
+        """Test that a streamed response is read only until both fields are complete."""
+        deltas = ["Sentiment: Neg", "ative\nSummary: Runs", " small.\n", "Extra text", " never read"]
+        consumed = []
+        
+        def chunks():
+            for delta in deltas:
+                consumed.append(delta)
+                yield Mock(choices=[Mock(delta=Mock(content=delta))])
+        
+        stream = MagicMock(spec=['__iter__', 'close'])
+        stream.__iter__.return_value = chunks()
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = stream
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_review_with_llm("Too tight")
+        
+        assert result == {'sentiment': 'Negative', 'summary': 'Runs small.'}
+        assert consumed == deltas[:3]
+        stream.close.assert_called_once()
 
 
 class TestBatchAnalyzeReviews:
@@ -216,11 +393,13 @@ class TestBatchAnalyzeReviews:
     @patch('src.llm_analysis.time.sleep')
     def test_batch_analyze_multiple_reviews(self, mock_sleep, mock_analyze):
         """Test batch analyzing multiple reviews."""
-        mock_analyze.side_effect = [
-            {'sentiment': 'Positive', 'summary': 'Great!'},
-            {'sentiment': 'Negative', 'summary': 'Bad!'},
-            {'sentiment': 'Neutral', 'summary': 'Okay.'}
-        ]
+        # Calls run concurrently, so map results by review instead of call order
+        analyses = {
+            "Great product": {'sentiment': 'Positive', 'summary': 'Great!'},
+            "Terrible": {'sentiment': 'Negative', 'summary': 'Bad!'},
+            "It's okay": {'sentiment': 'Neutral', 'summary': 'Okay.'}
+        }
+        mock_analyze.side_effect = lambda review, model, **kwargs: analyses[review]
         
         reviews = ["Great product", "Terrible", "It's okay"]
         
@@ -230,8 +409,49 @@ class TestBatchAnalyzeReviews:
         assert results[0]['sentiment'] == 'Positive'
         assert results[1]['sentiment'] == 'Negative'
         assert results[2]['sentiment'] == 'Neutral'
-        assert results[0]['action_needed'] == 'No'
-        assert results[1]['action_needed'] == 'Yes'
+        assert 'action_needed' not in results[0]
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_batch_analyze_packs_reviews_per_call(self, mock_get_client, mock_analyze):
+        """Test that batch_size packs several reviews into one JSON API call."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=(
+                '{"results": [{"id": 1, "sentiment": "Positive", "summary": "Great!"},'
+                ' {"id": 2, "sentiment": "Negative", "summary": "Bad!"}]}'
+            )))]
+        )
+        mock_get_client.return_value = mock_client
+        
+        results = batch_analyze_reviews(
+            ["Great product", "", "Terrible"],
+            show_progress=False,
+            requests_per_minute=None,
+            batch_size=10
+        )
+        
+        mock_client.chat.completions.create.assert_called_once()
+        mock_analyze.assert_not_called()
+        assert [r['sentiment'] for r in results] == ['Positive', '', 'Negative']
+        assert [r['summary'] for r in results] == ['Great!', '', 'Bad!']
+    
+    @patch('src.llm_analysis.analyze_reviews_chunk_with_llm')
+    def test_batch_analyze_caches_packed_results(self, mock_chunk, tmp_path):
+        """Test that results of packed calls are cached like single calls."""
+        mock_chunk.side_effect = lambda chunk, model, **kwargs: [
+            {'sentiment': 'Neutral', 'summary': review} for review in chunk
+        ]
+        cache_file = str(tmp_path / "cache.json")
+        reviews = ["A", "B", "C"]
+        
+        batch_analyze_reviews(reviews, show_progress=False, cache_file=cache_file,
+                              requests_per_minute=None, batch_size=2)
+        results = batch_analyze_reviews(reviews, show_progress=False, cache_file=cache_file,
+                                        requests_per_minute=None, batch_size=2)
+        
+        assert mock_chunk.call_count == 2
+        assert [r['summary'] for r in results] == reviews
     
     @patch('src.llm_analysis.analyze_review_with_llm')
     def test_batch_analyze_empty_list(self, mock_analyze):
@@ -257,11 +477,323 @@ class TestBatchAnalyzeReviews:
         """Test that rate limiting sleep is called."""
         mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Good'}
         
-        # Create 25 reviews to trigger rate limiting (at idx=20)
-        reviews = ["Review"] * 25
+        reviews = [f"Review {i}" for i in range(25)]
         
         results = batch_analyze_reviews(reviews, show_progress=False)
         
         assert len(results) == 25
-        # Should sleep once after 20 reviews
-        assert mock_sleep.call_count >= 1
\ No newline at end of file
+        # Every call after the first has to wait for a slot
+        assert mock_sleep.call_count >= 1
+    
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.time.monotonic', return_value=100.0)
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_first_minute_within_budget(self, mock_analyze, mock_monotonic, mock_sleep):
+        """Test that only one call starts at once, however many workers there are."""
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Good'}
+        
+        batch_analyze_reviews(
+            [f"Review {i}" for i in range(4)],
+            show_progress=False,
+            max_workers=4,
+            requests_per_minute=60
+        )
+        
+        assert sorted(c.args[0] for c in mock_sleep.call_args_list) == [1.0, 2.0, 3.0]
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis._RateLimiter.acquire')
+    def test_batch_analyze_skips_empty_reviews(self, mock_acquire, mock_analyze):
+        """Test that empty and missing reviews get empty results without an API call."""
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Good'}
+        
+        results = batch_analyze_reviews(["", None, float('nan'), "Good", "   "], show_progress=False)
+        
+        mock_analyze.assert_called_once()
+        assert mock_analyze.call_args.args == ("Good", "llama-3.3-70b-versatile")
+        assert mock_acquire.call_count == 1
+        assert [r['sentiment'] for r in results] == ['', '', '', 'Positive', '']
+        assert all(r['summary'] == '' for i, r in enumerate(results) if i != 3)
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_async(self, mock_analyze):
+        """Test that the async variant returns the same results from a worker thread."""
+        mock_analyze.side_effect = lambda review, model, **kwargs: {'sentiment': 'Positive', 'summary': review}
+        
+        results = asyncio.run(batch_analyze_reviews_async(
+            ["A", "B"], show_progress=False, requests_per_minute=None
+        ))
+        
+        assert [r['summary'] for r in results] == ["A", "B"]
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_preserves_order(self, mock_analyze):
+        """Test that results follow input order regardless of completion order."""
+        mock_analyze.side_effect = lambda review, model, **kwargs: {'sentiment': 'Positive', 'summary': review}
+        
+        reviews = [f"Review {i}" for i in range(15)]
+        
+        results = batch_analyze_reviews(reviews, show_progress=False, max_workers=4, requests_per_minute=None)
+        
+        assert [r['summary'] for r in results] == reviews
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_deduplicates_reviews(self, mock_analyze):
+        """Test that identical reviews are only sent to the LLM once."""
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Love it'}
+        
+        reviews = ["Love it!", "  Love it!  ", "Love it!"]
+        
+        results = batch_analyze_reviews(reviews, show_progress=False)
+        
+        assert len(results) == 3
+        assert all(r['sentiment'] == 'Positive' for r in results)
+        mock_analyze.assert_called_once()
+        assert mock_analyze.call_args.args == ("Love it!", "llama-3.3-70b-versatile")
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_reuses_cache_file(self, mock_analyze, tmp_path):
+        """Test that cached analyses are reused across runs."""
+        cache_file = str(tmp_path / "llm_cache.json")
+        mock_analyze.return_value = {'sentiment': 'Negative', 'summary': 'Bad'}
+        
+        batch_analyze_reviews(["Terrible"], show_progress=False, cache_file=cache_file)
+        results = batch_analyze_reviews(["Terrible"], show_progress=False, cache_file=cache_file)
+        
+        assert mock_analyze.call_count == 1
+        assert results[0]['sentiment'] == 'Negative'
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_does_not_cache_errors(self, mock_analyze, tmp_path):
+        """Test that failed analyses are retried on the next run."""
+        cache_file = str(tmp_path / "llm_cache.json")
+        mock_analyze.return_value = {'sentiment': 'Error', 'summary': 'Failed to analyze'}
+        
+        batch_analyze_reviews(["Review"], show_progress=False, cache_file=cache_file)
+        batch_analyze_reviews(["Review"], show_progress=False, cache_file=cache_file)
+        
+        assert mock_analyze.call_count == 2
+    
+    @pytest.mark.parametrize("content", ["[]", '"x"', "null"])
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_ignores_non_object_cache(self, mock_analyze, content, tmp_path, capsys):
+        """Test that a cache file holding valid JSON other than an object is ignored."""
+        cache_file = tmp_path / "llm_cache.json"
+        cache_file.write_text(content, encoding='utf-8')
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Good'}
+        
+        results = batch_analyze_reviews(["Review"], show_progress=False, cache_file=str(cache_file))
+        
+        assert results[0]['sentiment'] == 'Positive'
+        assert "expected a JSON object" in capsys.readouterr().out
+    
+    @patch('src.llm_analysis.orjson', None)
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    def test_batch_analyze_cache_without_orjson(self, mock_analyze, tmp_path):
+        """Test that the cache round-trips through the json module when orjson is missing."""
+        import json
+        cache_file = tmp_path / "llm_cache.json"
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Très joli'}
+        
+        batch_analyze_reviews(["Joli"], show_progress=False, cache_file=str(cache_file))
+        results = batch_analyze_reviews(["Joli"], show_progress=False, cache_file=str(cache_file))
+        
+        assert mock_analyze.call_count == 1
+        assert results[0]['summary'] == 'Très joli'
+        assert list(json.loads(cache_file.read_text(encoding='utf-8')).values()) == [
+            {'sentiment': 'Positive', 'summary': 'Très joli'}
+        ]
+
+
+class TestRateLimiter:
+    """Tests for the _RateLimiter token bucket."""
+    
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.time.monotonic', return_value=100.0)
+    def test_burst_then_spacing(self, mock_monotonic, mock_sleep):
+        """Test that calls beyond the burst are spaced by the interval."""
+        limiter = _RateLimiter(requests_per_minute=60, burst=2)
+        
+        for _ in range(4):
+            limiter.acquire()
+        
+        # Two calls start right away, then one per second
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+    
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.time.monotonic')
+    def test_idle_time_does_not_exceed_burst(self, mock_monotonic, mock_sleep):
+        """Test that a long idle period only earns `burst` immediate calls."""
+        mock_monotonic.return_value = 0.0
+        limiter = _RateLimiter(requests_per_minute=60, burst=2)
+        
+        mock_monotonic.return_value = 1000.0
+        for _ in range(3):
+            limiter.acquire()
+        
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class TestAnalyzeReviewsChunkWithLLM:
+    """Tests for analyze_reviews_chunk_with_llm function."""
+    
+    @staticmethod
+    def _mock_client(content):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=content))]
+        )
+        return mock_client
+    
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_parses_json_results(self, mock_get_client):
+        """Test that one API call returns results for every review."""
+        mock_get_client.return_value = self._mock_client(
+            '{"results": [{"id": 2, "sentiment": "negative", "summary": "Bad fit."},'
+            ' {"id": 1, "sentiment": "Positive", "summary": "Great dress."}]}'
+        )
+        
+        results = analyze_reviews_chunk_with_llm(["Love it", "Too small"])
+        
+        assert results == [
+            {'sentiment': 'Positive', 'summary': 'Great dress.'},
+            {'sentiment': 'Negative', 'summary': 'Bad fit.'}
+        ]
+        assert mock_get_client.return_value.chat.completions.create.call_count == 1
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_falls_back_on_invalid_json(self, mock_get_client, mock_analyze):
+        """Test fallback to single-review analysis when JSON is invalid."""
+        mock_get_client.return_value = self._mock_client("Sentiment: Positive")
+        mock_analyze.return_value = {'sentiment': 'Neutral', 'summary': 'Okay'}
+        
+        results = analyze_reviews_chunk_with_llm(["A", "B"])
+        
+        assert len(results) == 2
+        assert mock_analyze.call_count == 2
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_falls_back_for_missing_ids(self, mock_get_client, mock_analyze):
+        """Test that only reviews missing from the response are re-analyzed."""
+        mock_get_client.return_value = self._mock_client(
+            '{"results": [{"id": 1, "sentiment": "Positive", "summary": "Nice"}]}'
+        )
+        mock_analyze.return_value = {'sentiment': 'Negative', 'summary': 'Bad'}
+        
+        results = analyze_reviews_chunk_with_llm(["A", "B"])
+        
+        assert results[0]['sentiment'] == 'Positive'
+        assert results[1]['sentiment'] == 'Negative'
+        mock_analyze.assert_called_once()
+        assert mock_analyze.call_args.args == ("B", "llama-3.3-70b-versatile")
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_falls_back_for_null_fields(self, mock_get_client, mock_analyze):
+        """Test that a null summary is re-analyzed instead of becoming "None"."""
+        mock_get_client.return_value = self._mock_client(
+            '{"results": [{"id": 1, "sentiment": "Positive", "summary": null}]}'
+        )
+        mock_analyze.return_value = {'sentiment': 'Positive', 'summary': 'Nice'}
+        
+        results = analyze_reviews_chunk_with_llm(["A"])
+        
+        assert results == [{'sentiment': 'Positive', 'summary': 'Nice'}]
+        mock_analyze.assert_called_once()
+        assert mock_analyze.call_args.args == ("A", "llama-3.3-70b-versatile")
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_fallback_takes_limiter_slots(self, mock_get_client, mock_analyze):
+        """Test that single-review fallback calls are paced by the caller's limiter."""
+        mock_get_client.return_value = self._mock_client("not json")
+        mock_analyze.return_value = {'sentiment': 'Neutral', 'summary': 'Okay'}
+        limiter = Mock()
+        
+        analyze_reviews_chunk_with_llm(["A", "B"], limiter=limiter)
+        
+        assert limiter.acquire.call_count == 2
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_retries_transient_errors(self, mock_get_client, mock_sleep, mock_analyze):
+        """Test that a transient failure retries the packed call instead of fanning out."""
+        mock_client = self._mock_client(
+            '{"results": [{"id": 1, "sentiment": "Positive", "summary": "Nice"}]}'
+        )
+        mock_client.chat.completions.create.side_effect = [
+            _connection_error(),
+            mock_client.chat.completions.create.return_value
+        ]
+        mock_get_client.return_value = mock_client
+        
+        limiter = Mock()
+        
+        results = analyze_reviews_chunk_with_llm(["A"], limiter=limiter)
+        
+        assert results == [{'sentiment': 'Positive', 'summary': 'Nice'}]
+        assert mock_client.chat.completions.create.call_count == 2
+        mock_sleep.assert_called_once()
+        limiter.acquire.assert_called_once()
+        mock_analyze.assert_not_called()
+    
+    @patch('src.llm_analysis.analyze_review_with_llm')
+    @patch('src.llm_analysis.time.sleep')
+    @patch('src.llm_analysis.get_groq_client')
+    def test_chunk_gives_up_without_fanning_out(self, mock_get_client, mock_sleep, mock_analyze):
+        """Test that exhausted retries mark every review as failed without single calls."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = _connection_error()
+        mock_get_client.return_value = mock_client
+        
+        results = analyze_reviews_chunk_with_llm(["A", "B"], max_retries=2)
+        
+        assert results == [{'sentiment': 'Error', 'summary': 'Failed to analyze'}] * 2
+        assert mock_client.chat.completions.create.call_count == 2
+        mock_analyze.assert_not_called()
+
+
+class TestBatchAnalyzeReviewsBulk:
+    """Tests for batch_analyze_reviews_bulk function."""
+    
+    @patch('src.llm_analysis.analyze_reviews_chunk_with_llm')
+    def test_bulk_chunks_reviews(self, mock_chunk):
+        """Test that reviews are grouped into chunks of k."""
+        mock_chunk.side_effect = lambda chunk, model, **kwargs: [
+            {'sentiment': 'Negative', 'summary': review} for review in chunk
+        ]
+        
+        reviews = [f"Review {i}" for i in range(5)]
+        
+        results = batch_analyze_reviews_bulk(reviews, k=2, show_progress=False, requests_per_minute=None)
+        
+        assert mock_chunk.call_count == 3
+        assert [r['summary'] for r in results] == reviews
+        assert all(r['sentiment'] == 'Negative' for r in results)
+    
+    @patch('src.llm_analysis.analyze_reviews_chunk_with_llm')
+    def test_bulk_skips_empty_and_duplicate_reviews(self, mock_chunk):
+        """Test that empty reviews are not sent and duplicates are sent once."""
+        mock_chunk.side_effect = lambda chunk, model, **kwargs: [
+            {'sentiment': 'Positive', 'summary': review} for review in chunk
+        ]
+        
+        results = batch_analyze_reviews_bulk(["Nice", "", None, " Nice "], show_progress=False)
+        
+        mock_chunk.assert_called_once()
+        assert mock_chunk.call_args.args == (["Nice"], "llama-3.3-70b-versatile")
+        assert [r['sentiment'] for r in results] == ['Positive', '', '', 'Positive']
+    
+    @patch('src.llm_analysis.batch_analyze_reviews')
+    def test_bulk_delegates_to_batch_analyze_reviews(self, mock_batch):
+        """Test that the bulk variant shares batch_analyze_reviews' caching and pacing."""
+        result = batch_analyze_reviews_bulk(["A"], k=5, show_progress=False, cache_file="cache.json")
+        
+        assert result is mock_batch.return_value
+        kwargs = mock_batch.call_args.kwargs
+        assert kwargs['batch_size'] == 5
+        assert kwargs['cache_file'] == "cache.json"
+        assert kwargs['requests_per_minute'] == 30
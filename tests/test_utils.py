@@ -1,14 +1,18 @@
 """
 Unit tests for src/utils.py
 """
+import logging
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
 from src.utils import (
     clean_text,
+    clean_text_series,
+    downcast_integer_columns,
     validate_dataframe_columns,
     get_google_sheets_client,
-    get_spreadsheet
+    get_spreadsheet,
+    is_worksheet_protected
 )
 
 
@@ -40,6 +44,11 @@ class TestCleanText:
         result = clean_text(pd.NA)
         assert result == ""
     
+    def test_clean_text_with_float_nan(self):
+        """Test cleaning a float NaN value."""
+        result = clean_text(float('nan'))
+        assert result == ""
+    
     def test_clean_text_with_numeric(self):
         """Test cleaning numeric value."""
         result = clean_text(123)
@@ -51,6 +60,44 @@ class TestCleanText:
         assert result == "Hello World Test"
 
 
+class TestCleanTextSeries:
+    """Tests for the clean_text_series function."""
+    
+    def test_clean_text_series_matches_clean_text(self):
+        """Test that the vectorized version agrees with clean_text."""
+        values = ["  Hello World  ", "Hello    World   Test", "", None, "Hello\nWorld\n\nTest"]
+        
+        result = clean_text_series(pd.Series(values))
+        
+        assert result.tolist() == [clean_text(v) for v in values]
+    
+    def test_clean_text_series_with_mixed_types(self):
+        """Test cleaning a column holding numbers and text."""
+        result = clean_text_series(pd.Series([123, " x ", float('nan')], dtype=object))
+        
+        assert result.tolist() == ["123", "x", ""]
+
+
+class TestDowncastIntegerColumns:
+    """Tests for the downcast_integer_columns function."""
+    
+    def test_downcast_integer_columns(self):
+        """Test that only integer columns are downcast."""
+        df = pd.DataFrame({
+            'Rating': [1, 5],
+            'Count': [0, 1000],
+            'Score': [1.1, 2.2],
+            'Text': ['a', 'b']
+        })
+        
+        result = downcast_integer_columns(df)
+        
+        assert result['Rating'].dtype == 'int8'
+        assert result['Count'].dtype == 'int16'
+        assert result['Score'].dtype == 'float64'
+        assert result['Rating'].tolist() == [1, 5]
+
+
 class TestValidateDataframeColumns:
     """Tests for the validate_dataframe_columns function."""
     
@@ -64,8 +111,9 @@ class TestValidateDataframeColumns:
         result = validate_dataframe_columns(df, ['A', 'B'])
         assert result is True
     
-    def test_validate_with_missing_columns(self, capsys):
+    def test_validate_with_missing_columns(self, caplog):
         """Test validation when some columns are missing."""
+        caplog.set_level(logging.WARNING, logger='src.utils')
         df = pd.DataFrame({
             'A': [1, 2, 3],
             'B': [4, 5, 6]
@@ -73,10 +121,18 @@ class TestValidateDataframeColumns:
         result = validate_dataframe_columns(df, ['A', 'B', 'C'])
         assert result is False
         
-        # Check that error message was printed
-        captured = capsys.readouterr()
-        assert "Missing required columns" in captured.out
-        assert "'C'" in captured.out
+        # Check that error message was logged
+        assert "Missing required columns" in caplog.text
+        assert "'C'" in caplog.text
+    
+    def test_validate_reports_missing_columns_in_order(self, caplog):
+        """Test that missing columns are reported in the order they were required."""
+        caplog.set_level(logging.WARNING, logger='src.utils')
+        df = pd.DataFrame({'B': [1]})
+        result = validate_dataframe_columns(df, ['C', 'B', 'A'])
+        assert result is False
+        
+        assert "['C', 'A']" in caplog.text
     
     def test_validate_with_empty_required_list(self):
         """Test validation with empty required columns list."""
@@ -110,6 +166,68 @@ class TestGetGoogleSheetsClient:
         mock_creds.assert_called_once()
         mock_authorize.assert_called_once()
     
+    @patch('src.utils.Credentials.from_service_account_file')
+    @patch('src.utils.gspread.authorize')
+    @patch('os.path.exists')
+    def test_get_client_is_cached(self, mock_exists, mock_authorize, mock_creds):
+        """Test that repeated calls reuse the authenticated client."""
+        mock_exists.return_value = True
+        
+        first = get_google_sheets_client('test_creds.json')
+        second = get_google_sheets_client('test_creds.json')
+        
+        assert first is second
+        mock_authorize.assert_called_once()
+    
+    @patch('src.utils.Credentials.from_service_account_file')
+    @patch('src.utils.gspread.authorize')
+    @patch('os.path.exists')
+    def test_get_client_mounts_pooled_adapter(self, mock_exists, mock_authorize, mock_creds):
+        """Test that the client's session gets a pooled, retrying HTTPS adapter."""
+        from requests.adapters import HTTPAdapter
+        mock_exists.return_value = True
+        
+        client = get_google_sheets_client('test_creds.json')
+        
+        client.http_client.session.mount.assert_called_once()
+        prefix, adapter = client.http_client.session.mount.call_args.args
+        assert prefix == 'https://'
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.max_retries.total == 3
+    
+    @patch('urllib3.util.retry.time.sleep')
+    @patch('urllib3.connectionpool.HTTPConnectionPool._make_request')
+    @patch('src.utils.Credentials.from_service_account_file')
+    @patch('src.utils.gspread.authorize')
+    @patch('os.path.exists')
+    def test_get_client_adapter_surfaces_api_error(self, mock_exists, mock_authorize, mock_creds,
+                                                   mock_make_request, mock_sleep):
+        """Test that a 503 outlasting the retries reaches gspread as an APIError."""
+        import io
+        import requests
+        from urllib3 import HTTPResponse
+        from gspread.exceptions import APIError
+        from gspread.http_client import HTTPClient
+        mock_exists.return_value = True
+        mock_make_request.side_effect = lambda *args, **kwargs: HTTPResponse(
+            body=io.BytesIO(b'{"error": {"code": 503, "message": "Unavailable", "status": "UNAVAILABLE"}}'),
+            status=503,
+            headers={'Content-Type': 'application/json'},
+            preload_content=False
+        )
+        
+        client = get_google_sheets_client('test_creds.json')
+        adapter = client.http_client.session.mount.call_args.args[1]
+        http_client = HTTPClient(auth=Mock(), session=requests.Session())
+        http_client.session.mount('https://', adapter)
+        
+        with pytest.raises(APIError) as exc_info:
+            http_client.request('get', 'https://sheets.googleapis.com/v4/spreadsheets/test')
+        
+        assert exc_info.value.response.status_code == 503
+        # The first attempt plus three retries
+        assert mock_make_request.call_count == 4
+    
     @patch('os.path.exists')
     def test_get_client_missing_credentials(self, mock_exists):
         """Test client creation with missing credentials file."""
@@ -149,6 +267,31 @@ class TestGetSpreadsheet:
         assert result == mock_spreadsheet
         mock_client.open_by_key.assert_called_once_with('provided_sheet_id')
     
+    @patch('src.utils.get_google_sheets_client')
+    def test_get_spreadsheet_is_cached(self, mock_get_client):
+        """Test that each spreadsheet is opened only once."""
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        
+        first = get_spreadsheet('sheet_id')
+        second = get_spreadsheet('sheet_id')
+        
+        assert first is second
+        mock_client.open_by_key.assert_called_once_with('sheet_id')
+    
+    @patch('src.utils.load_dotenv')
+    @patch('src.utils._cached_spreadsheet')
+    def test_get_spreadsheet_loads_env_once(self, mock_cached, mock_load_dotenv, monkeypatch):
+        """Test that .env is loaded lazily, on the first env lookup only."""
+        monkeypatch.setattr('src.utils._env_loaded', False)
+        monkeypatch.setenv('GOOGLE_SHEET_ID', 'test_sheet_id')
+        
+        get_spreadsheet()
+        get_spreadsheet()
+        get_spreadsheet('explicit_id')
+        
+        mock_load_dotenv.assert_called_once()
+    
     @patch('src.utils.get_google_sheets_client')
     @patch.dict('os.environ', {}, clear=True)
     def test_get_spreadsheet_no_id(self, mock_get_client):
@@ -162,27 +305,264 @@ class TestGetSpreadsheet:
 class TestReadWriteWorksheet:
     """Tests for worksheet read/write operations."""
     
-    @patch('src.utils.pd.DataFrame')
-    def test_read_worksheet_to_dataframe(self, mock_df):
+    def test_read_worksheet_to_dataframe(self):
         """Test reading worksheet to dataframe."""
         from src.utils import read_worksheet_to_dataframe
         
         mock_worksheet = Mock()
-        mock_worksheet.get_all_records.return_value = [
-            {'A': 1, 'B': 2},
-            {'A': 3, 'B': 4}
+        mock_worksheet.get_all_values.return_value = [
+            ['A', 'B'],
+            ['1', 'x'],
+            ['3', '']
         ]
         
         result = read_worksheet_to_dataframe(mock_worksheet)
         
-        mock_worksheet.get_all_records.assert_called_once()
+        mock_worksheet.get_all_values.assert_called_once_with(value_render_option='FORMATTED_VALUE')
+        assert result.columns.tolist() == ['A', 'B']
+        assert result['A'].tolist() == [1, 3]
+        assert result['B'].tolist() == ['x', '']
     
-    def test_write_dataframe_to_worksheet(self):
-        """Test writing dataframe to worksheet."""
-        from src.utils import write_dataframe_to_worksheet
+    def test_read_worksheet_keeps_formatted_dates_and_percents(self):
+        """Test that formatted cells that are not plain numbers stay as displayed."""
+        from src.utils import read_worksheet_to_dataframe
         
+        mock_worksheet = Mock()
+        mock_worksheet.get_all_values.return_value = [
+            ['Date', 'Rate', 'Price'],
+            ['1/2/2024', '4.5%', '12.5']
+        ]
+        
+        result = read_worksheet_to_dataframe(mock_worksheet)
+        
+        assert result.iloc[0].tolist() == ['1/2/2024', '4.5%', 12.5]
+    
+    def test_read_worksheet_unformatted_values(self):
+        """Test that unformatted values are requested and used as they arrive."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.get_all_values.return_value = [
+            ['Date', 'Rate'],
+            [45293, 0.045]
+        ]
+        
+        result = read_worksheet_to_dataframe(mock_worksheet, value_render_option='UNFORMATTED_VALUE')
+        
+        mock_worksheet.get_all_values.assert_called_once_with(value_render_option='UNFORMATTED_VALUE')
+        assert result.iloc[0].tolist() == [45293, 0.045]
+    
+    def test_read_worksheet_cache_reuses_unchanged_sheet(self):
+        """Test that a cached read skips the download while the sheet is unchanged."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.id = 7
+        mock_worksheet.spreadsheet.id = 'sheet'
+        mock_worksheet.spreadsheet.get_lastUpdateTime.return_value = '2024-01-01T00:00:00.000Z'
+        mock_worksheet.get_all_values.return_value = [['A'], [1], [2]]
+        
+        first = read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        first['A'] = 0
+        second = read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        
+        mock_worksheet.get_all_values.assert_called_once()
+        assert second['A'].tolist() == [1, 2]
+    
+    def test_read_worksheet_cache_isolates_cell_edits(self):
+        """Test that editing a cached read in place does not change later reads."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.id = 7
+        mock_worksheet.spreadsheet.id = 'sheet'
+        mock_worksheet.spreadsheet.get_lastUpdateTime.return_value = '2024-01-01T00:00:00.000Z'
+        mock_worksheet.get_all_values.return_value = [['A', 'B'], [1, 'x'], [2, 'y']]
+        
+        first = read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        first.loc[0, 'A'] = 99
+        first.loc[1, 'B'] = 'z'
+        second = read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        
+        mock_worksheet.get_all_values.assert_called_once()
+        assert second['A'].tolist() == [1, 2]
+        assert second['B'].tolist() == ['x', 'y']
+    
+    def test_read_worksheet_cache_refetches_after_update(self):
+        """Test that a cached read is refreshed once the sheet has been modified."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.id = 7
+        mock_worksheet.spreadsheet.id = 'sheet'
+        mock_worksheet.spreadsheet.get_lastUpdateTime.side_effect = [
+            '2024-01-01T00:00:00.000Z',
+            '2024-01-02T00:00:00.000Z'
+        ]
+        mock_worksheet.get_all_values.side_effect = [[['A'], [1]], [['A'], [5]]]
+        
+        read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        result = read_worksheet_to_dataframe(mock_worksheet, use_cache=True)
+        
+        assert mock_worksheet.get_all_values.call_count == 2
+        assert result['A'].tolist() == [5]
+    
+    @patch('src.utils.PYARROW_AVAILABLE', True)
+    def test_read_worksheet_uses_arrow_strings(self):
+        """Test that text columns become Arrow-backed strings when pyarrow is installed."""
+        pytest.importorskip('pyarrow')
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.get_all_values.return_value = [
+            ['Text', 'Mixed', 'Number'],
+            ['a', 1, 5],
+            ['b', '', 6]
+        ]
+        
+        result = read_worksheet_to_dataframe(mock_worksheet)
+        
+        assert result['Text'].dtype == 'string[pyarrow]'
+        assert result['Mixed'].tolist() == [1, '']
+        assert pd.api.types.is_integer_dtype(result['Number'])
+    
+    def test_read_worksheet_with_polars(self):
+        """Test reading a worksheet into a polars DataFrame."""
+        pytest.importorskip('polars')
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.get_all_values.return_value = [
+            ['A', 'B'],
+            [1, 'x'],
+            [3, 'y']
+        ]
+        
+        result = read_worksheet_to_dataframe(mock_worksheet, engine='polars')
+        
+        assert result.columns == ['A', 'B']
+        assert result.to_pandas()['B'].tolist() == ['x', 'y']
+    
+    @patch('src.utils.pl', None)
+    def test_read_worksheet_polars_not_installed(self):
+        """Test that the polars engine fails clearly without polars."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        with pytest.raises(ImportError):
+            read_worksheet_to_dataframe(Mock(), engine='polars')
+    
+    def test_read_worksheet_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        with pytest.raises(ValueError):
+            read_worksheet_to_dataframe(Mock(), engine='spark')
+    
+    def test_read_worksheet_in_chunks(self):
+        """Test reading a worksheet chunk by chunk."""
+        from src.utils import read_worksheet_in_chunks
+        
+        mock_worksheet = Mock()
+        mock_worksheet.row_count = 5
+        mock_worksheet.row_values.return_value = ['A', 'B']
+        chunks = {
+            'A2:B3': [['1', 'x'], ['2']],
+            'A4:B5': [['3', 'z']]
+        }
+        mock_worksheet.get.side_effect = lambda range_name, **kwargs: chunks[range_name]
+        
+        result = list(read_worksheet_in_chunks(mock_worksheet, chunk_rows=2))
+        
+        assert mock_worksheet.get.call_args.kwargs == {'value_render_option': 'FORMATTED_VALUE'}
+        assert len(result) == 2
+        assert result[0].columns.tolist() == ['A', 'B']
+        assert result[0]['B'].tolist() == ['x', '']
+        assert result[1].index.tolist() == [2]
+        assert result[1]['A'].tolist() == [3]
+    
+    def test_read_worksheet_in_chunks_skips_empty_ranges(self):
+        """Test that empty trailing ranges and empty sheets yield no chunks."""
+        from src.utils import read_worksheet_in_chunks
+        
+        mock_worksheet = Mock()
+        mock_worksheet.row_count = 5
+        mock_worksheet.row_values.return_value = ['A']
+        mock_worksheet.get.side_effect = [[[1]], []]
+        
+        assert len(list(read_worksheet_in_chunks(mock_worksheet, chunk_rows=2))) == 1
+        
+        mock_worksheet.row_values.return_value = []
+        assert list(read_worksheet_in_chunks(mock_worksheet)) == []
+    
+    def test_read_worksheet_in_chunks_stops_at_end_of_data(self):
+        """Test that reading stops at the first empty range instead of the grid's last row."""
+        from src.utils import read_worksheet_in_chunks
+        
+        mock_worksheet = Mock()
+        mock_worksheet.row_count = 1000
+        mock_worksheet.row_values.return_value = ['A']
+        mock_worksheet.get.side_effect = [[['1'], ['2']], [['3']], []]
+        
+        result = list(read_worksheet_in_chunks(mock_worksheet, chunk_rows=2))
+        
+        assert len(result) == 2
+        assert mock_worksheet.get.call_count == 3
+    
+    def test_read_worksheet_in_chunks_keeps_first_chunk_dtypes(self):
+        """Test that later chunks take the column types of the first chunk."""
+        from src.utils import read_worksheet_in_chunks
+        
+        mock_worksheet = Mock()
+        mock_worksheet.row_count = 7
+        mock_worksheet.row_values.return_value = ['Rating', 'Score']
+        mock_worksheet.get.side_effect = [
+            [['5', '0.5'], ['4', '1.5']],
+            [['', '2'], ['3', 'n/a']],
+            [['2', '1']]
+        ]
+        
+        result = list(read_worksheet_in_chunks(mock_worksheet, chunk_rows=2))
+        
+        assert result[0]['Rating'].dtype == 'int64'
+        # Blanks turn an integer column into floats rather than text
+        assert result[1]['Rating'].dtype == 'float64'
+        assert result[1]['Rating'].isna().tolist() == [True, False]
+        assert result[1]['Score'].dtype == 'float64'
+        assert result[2]['Rating'].dtype == 'int64'
+        assert result[2]['Score'].tolist() == [1.0]
+    
+    def test_read_empty_worksheet(self):
+        """Test reading an empty worksheet returns an empty DataFrame."""
+        from src.utils import read_worksheet_to_dataframe
+        
+        mock_worksheet = Mock()
+        mock_worksheet.get_all_values.return_value = []
+        
+        result = read_worksheet_to_dataframe(mock_worksheet)
+        
+        assert result.empty
+    
+    @staticmethod
+    def _mock_worksheet(row_count=1000, col_count=26):
         mock_worksheet = Mock()
         mock_worksheet.title = "test_sheet"
+        mock_worksheet.id = 7
+        mock_worksheet.row_count = row_count
+        mock_worksheet.col_count = col_count
+        return mock_worksheet
+    
+    @staticmethod
+    def _written_rows(request):
+        return [
+            [cell.get('userEnteredValue', {}) for cell in row['values']]
+            for row in request['updateCells']['rows']
+        ]
+    
+    def test_write_dataframe_to_worksheet(self):
+        """Test writing dataframe to worksheet in a single batch update."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
         
         df = pd.DataFrame({
             'A': [1, 2, 3],
@@ -191,8 +571,160 @@ class TestReadWriteWorksheet:
         
         write_dataframe_to_worksheet(mock_worksheet, df, clear_first=True)
         
-        mock_worksheet.clear.assert_called_once()
-        mock_worksheet.update.assert_called_once()
+        mock_worksheet.clear.assert_not_called()
+        mock_worksheet.update.assert_not_called()
+        mock_worksheet.spreadsheet.batch_update.assert_called_once()
+        requests = mock_worksheet.spreadsheet.batch_update.call_args.args[0]['requests']
+        
+        assert len(requests) == 2
+        assert requests[0]['updateCells']['range'] == {'sheetId': 7}
+        assert requests[1]['updateCells']['start'] == {'sheetId': 7, 'rowIndex': 0, 'columnIndex': 0}
+        assert self._written_rows(requests[1]) == [
+            [{'stringValue': 'A'}, {'stringValue': 'B'}],
+            [{'numberValue': 1}, {'numberValue': 4}],
+            [{'numberValue': 2}, {'numberValue': 5}],
+            [{'numberValue': 3}, {'numberValue': 6}]
+        ]
+    
+    def test_write_dataframe_with_categorical_and_missing_values(self):
+        """Test that categoricals and missing values are written as plain values."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        df = pd.DataFrame({
+            'AI Sentiment': pd.Categorical(['Positive', None], categories=['Positive', 'Negative']),
+            'Score': [1.5, float('nan')],
+            'Flag': [True, False]
+        })
+        
+        write_dataframe_to_worksheet(mock_worksheet, df)
+        
+        requests = mock_worksheet.spreadsheet.batch_update.call_args.args[0]['requests']
+        assert self._written_rows(requests[-1]) == [
+            [{'stringValue': 'AI Sentiment'}, {'stringValue': 'Score'}, {'stringValue': 'Flag'}],
+            [{'stringValue': 'Positive'}, {'numberValue': 1.5}, {'boolValue': True}],
+            [{}, {}, {'boolValue': False}]
+        ]
+    
+    def test_write_infinite_floats_as_text(self):
+        """Test that infinite floats are written as text, which JSON can carry."""
+        import json
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        df = pd.DataFrame({'Ratio': [float('inf'), float('-inf'), 0.5]})
+        
+        write_dataframe_to_worksheet(mock_worksheet, df, clear_first=False)
+        
+        body = mock_worksheet.spreadsheet.batch_update.call_args.args[0]
+        assert self._written_rows(body['requests'][0]) == [
+            [{'stringValue': 'Ratio'}],
+            [{'stringValue': 'inf'}],
+            [{'stringValue': '-inf'}],
+            [{'numberValue': 0.5}]
+        ]
+        json.dumps(body, allow_nan=False)
+    
+    def test_write_grows_small_worksheet(self):
+        """Test that rows and columns are appended when the grid is too small."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet(row_count=2, col_count=1)
+        
+        df = pd.DataFrame({
+            'A': [1, 2, 3],
+            'B': [4, 5, 6]
+        })
+        
+        write_dataframe_to_worksheet(mock_worksheet, df, clear_first=False)
+        
+        requests = mock_worksheet.spreadsheet.batch_update.call_args.args[0]['requests']
+        assert requests[0]['appendDimension'] == {'sheetId': 7, 'dimension': 'ROWS', 'length': 2}
+        assert requests[1]['appendDimension'] == {'sheetId': 7, 'dimension': 'COLUMNS', 'length': 1}
+        assert 'updateCells' in requests[2]
+    
+    @patch('src.utils.MAX_CELLS_PER_REQUEST', 4)
+    def test_write_large_dataframe_in_blocks(self):
+        """Test that large DataFrames are split into bounded requests."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        df = pd.DataFrame({
+            'A': [1, 2, 3],
+            'B': [4, 5, 6]
+        })
+        
+        write_dataframe_to_worksheet(mock_worksheet, df, clear_first=True)
+        
+        calls = mock_worksheet.spreadsheet.batch_update.call_args_list
+        assert len(calls) == 2
+        first, second = (call.args[0]['requests'] for call in calls)
+        # The clear and the header only go out with the first request, which
+        # holds no more than four cells
+        assert len(first) == 2 and 'range' in first[0]['updateCells']
+        assert first[1]['updateCells']['start']['rowIndex'] == 0
+        assert len(self._written_rows(first[1])) == 2
+        # The rest of the first chunk continues where the request was cut
+        assert [r['updateCells']['start']['rowIndex'] for r in second] == [2, 3]
+        assert self._written_rows(second[1]) == [
+            [{'numberValue': 3}, {'numberValue': 6}]
+        ]
+    
+    @patch('src.utils.MAX_PAYLOAD_CHARS_PER_REQUEST', 200)
+    def test_write_long_text_splits_requests_by_size(self):
+        """Test that long text splits a write even when the cell count fits."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        df = pd.DataFrame({'Review Text': ['x' * 100, 'y' * 100, 'z']})
+        
+        write_dataframe_to_worksheet(mock_worksheet, df, clear_first=False)
+        
+        calls = mock_worksheet.spreadsheet.batch_update.call_args_list
+        starts = [
+            [r['updateCells']['start']['rowIndex'] for r in call.args[0]['requests']]
+            for call in calls
+        ]
+        # Header and first review, then the second review with the short third
+        assert starts == [[0], [2]]
+        assert self._written_rows(calls[1].args[0]['requests'][0]) == [
+            [{'stringValue': 'y' * 100}],
+            [{'stringValue': 'z'}]
+        ]
+    
+    @patch('src.utils.CHUNK_ROWS', 1)
+    def test_write_groups_small_chunks_into_one_request(self):
+        """Test that chunks are grouped into one request when they fit."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        df = pd.DataFrame({
+            'A': [1, 2, 3],
+            'B': [4, 5, 6]
+        })
+        
+        write_dataframe_to_worksheet(mock_worksheet, df, clear_first=False)
+        
+        mock_worksheet.spreadsheet.batch_update.assert_called_once()
+        requests = mock_worksheet.spreadsheet.batch_update.call_args.args[0]['requests']
+        assert [r['updateCells']['start']['rowIndex'] for r in requests] == [0, 2, 3]
+        assert self._written_rows(requests[2]) == [[{'numberValue': 3}, {'numberValue': 6}]]
+    
+    def test_write_empty_dataframe_writes_header(self):
+        """Test that an empty DataFrame still gets its header row."""
+        from src.utils import write_dataframe_to_worksheet
+        
+        mock_worksheet = self._mock_worksheet()
+        
+        write_dataframe_to_worksheet(mock_worksheet, pd.DataFrame(columns=['A', 'B']), clear_first=False)
+        
+        requests = mock_worksheet.spreadsheet.batch_update.call_args.args[0]['requests']
+        assert self._written_rows(requests[0]) == [[{'stringValue': 'A'}, {'stringValue': 'B'}]]
 
 
 class TestWorksheetOperations:
@@ -211,11 +743,13 @@ class TestWorksheetOperations:
         assert result == mock_worksheet
         mock_spreadsheet.worksheet.assert_called_once_with('test_sheet')
     
-    def test_create_worksheet_if_not_exists_new(self, capsys):
+    def test_create_worksheet_if_not_exists_new(self, caplog):
         """Test creating a new worksheet."""
         from src.utils import create_worksheet_if_not_exists
         import gspread
         
+        caplog.set_level(logging.INFO, logger='src.utils')
+        
         mock_spreadsheet = Mock()
         mock_worksheet = Mock()
         mock_spreadsheet.worksheet.side_effect = gspread.exceptions.WorksheetNotFound
@@ -226,13 +760,14 @@ class TestWorksheetOperations:
         assert result == mock_worksheet
         mock_spreadsheet.add_worksheet.assert_called_once()
         
-        captured = capsys.readouterr()
-        assert "created successfully" in captured.out
+        assert "created successfully" in caplog.text
     
-    def test_create_worksheet_if_not_exists_existing(self, capsys):
+    def test_create_worksheet_if_not_exists_existing(self, caplog):
         """Test with existing worksheet."""
         from src.utils import create_worksheet_if_not_exists
         
+        caplog.set_level(logging.INFO, logger='src.utils')
+        
         mock_spreadsheet = Mock()
         mock_worksheet = Mock()
         mock_spreadsheet.worksheet.return_value = mock_worksheet
@@ -241,5 +776,50 @@ class TestWorksheetOperations:
         
         assert result == mock_worksheet
         
-        captured = capsys.readouterr()
-        assert "already exists" in captured.out
\ No newline at end of file
+        assert "already exists" in caplog.text
+
+
+class TestIsWorksheetProtected:
+    """Tests for is_worksheet_protected function."""
+    
+    @staticmethod
+    def _mock_worksheet(protected_ranges):
+        mock_worksheet = Mock()
+        mock_worksheet.id = 7
+        mock_worksheet.spreadsheet.id = 'sheet'
+        mock_worksheet.spreadsheet.list_protected_ranges.return_value = protected_ranges
+        return mock_worksheet
+    
+    def test_protected_worksheet(self):
+        """Test that a worksheet with protected ranges is reported as protected."""
+        mock_worksheet = self._mock_worksheet([{'protectedRangeId': 1}])
+        
+        assert is_worksheet_protected(mock_worksheet) is True
+        mock_worksheet.spreadsheet.list_protected_ranges.assert_called_once_with(7)
+    
+    def test_result_is_cached(self):
+        """Test that repeated checks reuse the cached status."""
+        mock_worksheet = self._mock_worksheet([])
+        
+        assert is_worksheet_protected(mock_worksheet) is False
+        assert is_worksheet_protected(mock_worksheet) is False
+        
+        mock_worksheet.spreadsheet.list_protected_ranges.assert_called_once()
+    
+    def test_cache_expires(self):
+        """Test that the status is looked up again after the TTL."""
+        mock_worksheet = self._mock_worksheet([])
+        
+        with patch('src.utils.time.monotonic', side_effect=[0.0, 1000.0, 1000.0]):
+            is_worksheet_protected(mock_worksheet)
+            is_worksheet_protected(mock_worksheet)
+        
+        assert mock_worksheet.spreadsheet.list_protected_ranges.call_count == 2
+    
+    def test_errors_are_not_cached(self):
+        """Test that a failed lookup returns False and is retried next time."""
+        mock_worksheet = self._mock_worksheet([])
+        mock_worksheet.spreadsheet.list_protected_ranges.side_effect = [Exception("API error"), [{'protectedRangeId': 1}]]
+        
+        assert is_worksheet_protected(mock_worksheet) is False
+        assert is_worksheet_protected(mock_worksheet) is True